@@ -13,12 +13,18 @@ __maintainer__ = "Pieter Jan Haest"
 __email__ = "geo.haest@gmail.com"
 __status__ = "Development"
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
 from owslib.wfs import WebFeatureService
 from owslib import fes
+from lxml import etree
 import xmltodict
 import pandas as pd
 import numpy as np
+import json
 import os
+import re
 
 
 class DOVVariableError(Exception):
@@ -138,7 +144,26 @@ class DovBoringen(object):
             'hydrogeologischeinterpretatie': interpretation_atts +
                         ['aquifer', 'regime'], }
 
-    def get_boringen(self, query_string='', bbox=None, add_props=[]):
+    # tokenize "property operator literal" triples, where the literal of the
+    # PropertyIsBetween operator (<<) is a parenthesized "(lower, upper)" pair
+    _QUERY_RE = re.compile(r'(\w+)\s+(<<|[<>=!]+)\s+(\([^)]*\)|[^\s,]+)')
+
+    # numeric layer attributes: the wfs returns these as text, so declare
+    # their dtype up-front instead of leaving them as object columns
+    _NUMERIC_COLUMNS = ('X_mL72', 'Y_mL72', 'Z_mTAW', 'diepte_tot_m',
+                        'dikte_quartair')
+
+    # enumerable layer attributes with low cardinality: storing them as
+    # categoricals avoids keeping one string object per row
+    _CATEGORICAL_COLUMNS = ('methode', 'formele_stratigrafie',
+                            'gecodeerde_lithologie', 'geotechnische_codering',
+                            'hydrogeologische_stratigrafie',
+                            'informele_hydrostratigrafie',
+                            'informele_stratigrafie',
+                            'lithologische_beschrijving')
+
+    def get_boringen(self, query_string='', bbox=None, add_props=[],
+                     page_size=None):
         """Query the wfs_boring for a all boreholes within a selected
         bounding box or given constraints.
 
@@ -168,6 +193,11 @@ class DovBoringen(object):
             A list with the PropertyNames of attributes in the queried layer
             that need to be selected in addition
             to the default ones
+        page_size : int, optional
+            When given, the features are retrieved in pages of this size
+            (using WFS paging with startindex, requires version 2.0.0) and
+            the pages are downloaded in parallel. Defaults to None, issuing
+            a single request for all features.
 
         Returns
         -------
@@ -187,32 +217,60 @@ class DovBoringen(object):
         propertynames = variables1 if self.version == '1.1.0' else variables2
         # query the wfs layer for the given constraints in the bounding box
         # filterxml = self.compose_query(query_string, bbox, self.wfs_filters)
-        response = self.wfs_boring.getfeature(typename=self.layer,
-                                              propertyname=propertynames,
-                                              # gives service exception for
-                                              # version 1.1.0
-                                              maxfeatures=self.maxfeatures,
-                                              # filter=filterxml,
-                                              #  took ages to query, bbox is
-                                              # faster
-                                              bbox=bbox,
-                                              # outputFormat=self.outputformat
-                                              #   xml is only option and
-                                              #   possible error
-                                              # srsname=self.srsname  # does
-                                              # not work for version 2.0.0
-                                              )
-        if self.version == '1.1.0':
-            boringen_df = pd.DataFrame(
-                self.parse_wfs(response, self.layer, self.version),
-                columns=variables1
-            ).rename(columns=dict(zip(dov_defined, user_defined)))
-        elif self.version == '2.0.0':
-            boringen_df = pd.DataFrame(
-                self.parse_wfs(response, self.layer, self.version),
-                columns=variables2
-            ).rename(columns=dict(
-                zip(['dov-pub:' + x for x in dov_defined], user_defined)))
+        getfeature_kwargs = dict(typename=self.layer,
+                                 propertyname=propertynames,
+                                 # gives service exception for version 1.1.0
+                                 maxfeatures=self.maxfeatures,
+                                 # filter=filterxml,
+                                 #  took ages to query, bbox is faster
+                                 bbox=bbox,
+                                 # srsname=self.srsname  # does not work for
+                                 # version 2.0.0
+                                 )
+
+        def fetch_features(**kwargs):
+            kwargs = dict(getfeature_kwargs, **kwargs)
+            if self.outputformat == 'application/json':
+                # json is both smaller on the wire and cheaper to decode
+                # than the default GML output
+                response = self.wfs_boring.getfeature(
+                    outputFormat=self.outputformat, **kwargs)
+                doc = json.load(response)
+                return (
+                    tuple(feature['properties'].get(v) for v in variables1)
+                    for feature in doc['features'])
+            # xml fallback: parse_wfs yields dicts keyed on the
+            # namespace-stripped element names, so both versions map to the
+            # unprefixed variable names
+            response = self.wfs_boring.getfeature(**kwargs)
+            return (
+                tuple(feature.get(v) for v in variables1)
+                for feature in self.parse_wfs(response, self.layer,
+                                              self.version))
+
+        if page_size is None or self.version == '1.1.0':
+            # single request for all features; version 1.1.0 has no paging
+            features = fetch_features()
+        else:
+            # fetch the pages in parallel to overlap the network latency,
+            # keeping them in page order for a deterministic dataframe
+            pages = range(-(-self.maxfeatures // page_size))
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                features = chain.from_iterable(
+                    list(executor.map(
+                        lambda page: list(fetch_features(
+                            startindex=page * page_size,
+                            maxfeatures=min(page_size, self.maxfeatures -
+                                            page * page_size))),
+                        pages)))
+        dtypes = {col: 'float64' for col in self._NUMERIC_COLUMNS
+                  if col in variables1}
+        dtypes.update({col: 'category' for col in self._CATEGORICAL_COLUMNS
+                       if col in variables1})
+        boringen_df = pd.DataFrame.from_records(
+            features, columns=variables1, nrows=self.maxfeatures
+        ).astype(dtypes, copy=False).rename(
+            columns=dict(zip(dov_defined, user_defined)))
         return boringen_df
 
     @staticmethod
@@ -220,6 +278,12 @@ class DovBoringen(object):
         """A generator to parse the response from a wfs, depending on the
         server version
 
+        Instead of building the full response document in memory, the
+        features are parsed one by one with lxml and yielded as soon as
+        their closing tag is seen, keeping the memory footprint bounded to
+        a single feature. The keys of the yielded dictionaries are the
+        element names with their namespace stripped.
+
         Parameters
         ----------
         response : StringIO
@@ -230,20 +294,17 @@ class DovBoringen(object):
             The version of the WFS server: only '1.1.0' and '2.0.0'
 
         """
-        if version == "1.1.0":
-            # convert layer preposition to null
-            layer = 'null:' + layer.split(':')[1]
-            # convert the response to a dictionary
-            doc = xmltodict.parse(response)
-            # yield the layers of the dict
-            for a in doc['wfs:FeatureCollection']['gml:featureMembers']:
-                yield (a[layer])
-        elif version == "2.0.0":
-            # convert the response to a dictionary
-            doc = xmltodict.parse(response.read())
-            # yield the layers of the dict
-            for a in doc['wfs:FeatureCollection']['wfs:member']:
-                yield (a[layer])
+        feature_tag = layer.split(':')[-1]
+
+        for _, elem in etree.iterparse(response, events=('end',)):
+            if elem.tag.split('}')[-1] == feature_tag:
+                yield {child.tag.split('}')[-1]: child.text
+                       for child in elem}
+                # release the parsed feature and its preceding siblings to
+                # keep the partial tree from growing with the response
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
 
     @staticmethod
     def compose_query(query_string, bbox, wfs_filters):
@@ -279,24 +340,22 @@ class DovBoringen(object):
         filters = []
         # extract criteria
         if query_string:
-            query_raw = [x.strip(' ,') for x in query_string.split(' ')]
-            if len(query_raw) % 3 != 0:
+            matches = DovBoringen._QUERY_RE.findall(query_string)
+            if not matches:
                 raise ValueError('The query string is not correct. '
                                  'It should be composed of "property operator '
                                  'literal"')
-            idx = 1
-            for fltr in query_raw[1::3]:
+            for prop, fltr, literal in matches:
                 if fltr != '<<':
                     filters.append(
-                        wfs_filters[fltr](propertyname=query_raw[idx - 1],
-                                          literal=query_raw[idx + 1]))
+                        wfs_filters[fltr](propertyname=prop,
+                                          literal=literal))
                 else:
-                    lb, ub = [x.strip(['(', ')']) for x in
-                              query_raw[idx + 1].split(',')]
+                    lb, ub = [x.strip() for x in
+                              literal.strip('()').split(',')]
                     filters.append(
-                        wfs_filters[fltr](propertyname=query_raw[idx - 1],
-                                          lowerboundary=lb, upperboundary=ub))
-                    idx += 3
+                        wfs_filters[fltr](propertyname=prop,
+                                          lower=lb, upper=ub))
         if bbox:
             filters.append(fes.BBox(bbox))
         if len(filters) == 1:
@@ -350,8 +409,12 @@ class DovBoringen(object):
             interpretation defined by self.df_cols_dict
 
         """
-        with open(file) as fd:
-            xml_data = xmltodict.parse(fd.read())
+        with open(file, 'rb') as fd:
+            # none of the extracted elements use attributes, so skip the
+            # @-prefixed dict entries; streaming the file object avoids
+            # reading the full document into a string first
+            xml_data = xmltodict.parse(fd, xml_attribs=False,
+                                       process_namespaces=False)
             tmp = []
             for loc in xml_data['ns2:dov-schema']['boring']:
                 # sometimes multiple methods during one drilling in xml
@@ -2,6 +2,7 @@
 """Module containing the abstract search classes to retrieve DOV data."""
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from distutils.util import strtobool
 
 import owslib
@@ -21,6 +22,55 @@ from pydov.util.errors import (FeatureOverflowError, InvalidFieldError,
 from pydov.util.hooks import HookRunner
 
 
+def _typeconvert_string(x):
+    return u'' + (x.strip())
+
+
+def _typeconvert_integer(x):
+    return int(x)
+
+
+def _typeconvert_float(x):
+    return float(x)
+
+
+def _typeconvert_date(x):
+    # Patch for Zulu-time issue of geoserver for WFS 1.1.0
+    if x.endswith('Z'):
+        return datetime.datetime.strptime(x, '%Y-%m-%dZ').date() \
+            + datetime.timedelta(days=1)
+    else:
+        return datetime.datetime.strptime(x, '%Y-%m-%d').date()
+
+
+def _typeconvert_datetime(x):
+    if x.endswith('Z'):
+        return datetime.datetime.strptime(
+            x, '%Y-%m-%dT%H:%M:%SZ').date() \
+            + datetime.timedelta(days=1)
+    else:
+        return datetime.datetime.strptime(
+            x.split('.')[0], '%Y-%m-%dT%H:%M:%S')
+
+
+def _typeconvert_boolean(x):
+    return strtobool(x) == 1
+
+
+def _typeconvert_default(x):
+    return x
+
+
+_typeconverters = {
+    'string': _typeconvert_string,
+    'integer': _typeconvert_integer,
+    'float': _typeconvert_float,
+    'date': _typeconvert_date,
+    'datetime': _typeconvert_datetime,
+    'boolean': _typeconvert_boolean,
+}
+
+
 class AbstractCommon(object):
     """Class grouping methods common to AbstractSearch and
     AbstractTypeCommon."""
@@ -44,40 +94,7 @@ class AbstractCommon(object):
             `returntype`.
 
         """
-        if returntype == 'string':
-            def typeconvert(x):
-                return u'' + (x.strip())
-        elif returntype == 'integer':
-            def typeconvert(x):
-                return int(x)
-        elif returntype == 'float':
-            def typeconvert(x):
-                return float(x)
-        elif returntype == 'date':
-            def typeconvert(x):
-                # Patch for Zulu-time issue of geoserver for WFS 1.1.0
-                if x.endswith('Z'):
-                    return datetime.datetime.strptime(x, '%Y-%m-%dZ').date() \
-                        + datetime.timedelta(days=1)
-                else:
-                    return datetime.datetime.strptime(x, '%Y-%m-%d').date()
-        elif returntype == 'datetime':
-            def typeconvert(x):
-                if x.endswith('Z'):
-                    return datetime.datetime.strptime(
-                        x, '%Y-%m-%dT%H:%M:%SZ').date() \
-                        + datetime.timedelta(days=1)
-                else:
-                    return datetime.datetime.strptime(
-                        x.split('.')[0], '%Y-%m-%dT%H:%M:%S')
-        elif returntype == 'boolean':
-            def typeconvert(x):
-                return strtobool(x) == 1
-        else:
-            def typeconvert(x):
-                return x
-
-        return typeconvert(text)
+        return _typeconverters.get(returntype, _typeconvert_default)(text)
 
 
 class AbstractSearch(AbstractCommon):
@@ -163,11 +180,27 @@ class AbstractSearch(AbstractCommon):
 
         """
         if self._fields is None:
-            if self._wfs_schema is None:
-                self._wfs_schema = self._get_schema()
+            self._init_wfs()
 
-            if self._md_metadata is None:
-                self._md_metadata = self._get_remote_metadata()
+            # the schema, the metadata and the XSD schemas target
+            # independent URLs: fetch them concurrently so initialisation
+            # waits for the slowest request instead of the sum
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                if self._wfs_schema is None:
+                    schema_future = executor.submit(self._get_schema)
+                if self._md_metadata is None:
+                    md_future = executor.submit(self._get_remote_metadata)
+                if self._xsd_schemas is None:
+                    xsd_future = executor.submit(self._get_remote_xsd_schemas)
+
+                if self._wfs_schema is None:
+                    self._wfs_schema = schema_future.result()
+
+                if self._md_metadata is None:
+                    self._md_metadata = md_future.result()
+
+                if self._xsd_schemas is None:
+                    self._xsd_schemas = xsd_future.result()
 
             if self._fc_featurecatalogue is None:
                 csw_url = self._get_csw_base_url()
@@ -175,20 +208,27 @@ class AbstractSearch(AbstractCommon):
                 self._fc_featurecatalogue = \
                     owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
 
-            if self._xsd_schemas is None:
-                self._xsd_schemas = self._get_remote_xsd_schemas()
-
             fields = self._build_fields(
                 self._wfs_schema,
                 self._fc_featurecatalogue,
                 self._xsd_schemas)
 
+            known_fields = set(self._type.get_field_names(
+                include_wfs_injected=True))
+            fields_injected = False
+
             for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
+                if field['name'] not in known_fields:
                     self._type.fields.append(
                         _WfsInjectedField(name=field['name'],
                                           datatype=field['type']))
+                    known_fields.add(field['name'])
+                    fields_injected = True
+
+            if fields_injected:
+                # invalidate the cached field metadata of the type, as the
+                # injected fields changed it
+                pydov.types.abstract.clear_caches()
 
             self._fields = self._build_fields(
                 self._wfs_schema,
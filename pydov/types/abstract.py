@@ -4,12 +4,14 @@
 import types
 import warnings
 from collections import OrderedDict
+from functools import lru_cache
 
 import numpy as np
 from owslib.etree import etree
 
 import pydov
-from pydov.search.abstract import AbstractCommon
+from pydov.search.abstract import (AbstractCommon, _typeconvert_default,
+                                   _typeconverters)
 from pydov.types.fields import AbstractField
 from pydov.util.dovutil import get_dov_xml, parse_dov_xml
 from pydov.util.errors import RemoteFetchError, XmlFetchWarning
@@ -19,6 +21,325 @@ from ..util.errors import InvalidFieldError, XmlParseError, XmlParseWarning
 from ..util.hooks import HookRunner
 
 
+@lru_cache(maxsize=None)
+def _build_xpath(xpath, namespace):
+    """Build the full XML path of an element, prefixing each item in the
+    given path with the namespace.
+
+    Cached per (xpath, namespace) pair, as the same paths are rebuilt for
+    every row when parsing WFS and XML data.
+
+    Parameters
+    ----------
+    xpath : str
+        XML path of the element.
+    namespace : str or None
+        Namespace to be added to each item in the `xpath`. None to use
+        the xpath as is.
+
+    Returns
+    -------
+    str
+        The fully namespace-prefixed XML path.
+
+    """
+    if namespace is not None:
+        ns = '{{{}}}'.format(namespace)
+        return './' + ns + ('/' + ns).join(xpath.split('/'))
+    return './' + xpath.lstrip('/')
+
+
+def _extract_feature_values(feature):
+    """Map the direct children of a WFS feature element to their text.
+
+    Built in a single pass over the element, so field values can be
+    looked up by tag instead of launching one tree search per field.
+    Matches the semantics of `findtext`: the first occurrence of a tag
+    wins and an element without text maps to an empty string.
+
+    Parameters
+    ----------
+    feature : etree.Element
+        XML element representing a single record of a WFS layer.
+
+    Returns
+    -------
+    dict<str,str>
+        Dictionary mapping the (namespace-qualified) tag of each direct
+        child element to its text.
+
+    """
+    values = {}
+    for child in feature:
+        if child.tag not in values:
+            values[child.tag] = \
+                child.text if child.text is not None else ''
+    return values
+
+
+@lru_cache(maxsize=None)
+def _get_subtype_field_names(cls):
+    """Return the field names of the given subtype class as a tuple.
+
+    Cached per class; clear_caches() invalidates the cache whenever
+    the fields of a type are changed at runtime.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovSubType
+        Subtype class to list the field names of.
+
+    Returns
+    -------
+    tuple<str>
+        Tuple of the field names of this subtype.
+
+    """
+    return tuple(f['name'] for f in cls.fields)
+
+
+@lru_cache(maxsize=None)
+def _get_subtype_fields(cls):
+    """Return the field metadata of the given subtype class.
+
+    Cached per class; clear_caches() invalidates the cache whenever
+    the fields of a type are changed at runtime.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovSubType
+        Subtype class to list the fields of.
+
+    Returns
+    -------
+    collections.OrderedDict<str,dict>
+        Ordered dictionary mapping the field (column) name to the
+        dictionary containing the metadata of this field.
+
+    """
+    return OrderedDict(
+        zip([f['name'] for f in cls.fields],
+            [f for f in cls.fields]))
+
+
+@lru_cache(maxsize=None)
+def _get_subtype_field_specs(cls):
+    """Return the XML field parse specifications of the given subtype class.
+
+    Cached per class, so the field metadata is distilled only once
+    instead of for every record in an XML document; clear_caches()
+    invalidates the cache whenever the fields of a type are changed at
+    runtime.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovSubType
+        Subtype class to list the fields of.
+
+    Returns
+    -------
+    tuple<tuple<str,str,function>>
+        Tuple of (name, sourcefield, converter) tuples, one for each
+        field of this subtype. The converter parses a text value into
+        the datatype of the field.
+
+    """
+    return tuple(
+        (field['name'], field['sourcefield'],
+         _typeconverters.get(field.get('type', None), _typeconvert_default))
+        for field in cls.fields)
+
+
+@lru_cache(maxsize=None)
+def _get_type_field_names(cls, return_fields, include_subtypes,
+                          include_wfs_injected):
+    """Return the field names of the given type class as a tuple.
+
+    Cached per class and argument combination; clear_caches()
+    invalidates the cache whenever the fields of a type are changed
+    at runtime.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovType
+        Type class to list the field names of.
+    return_fields : tuple<str> or None
+        Tuple of fields to include in the data array. The order is
+        ignored, the default order of the fields of the datatype is used
+        instead. None will include all fields.
+    include_subtypes : boolean
+        Whether to include fields defined in subtypes (True) or not (False).
+    include_wfs_injected : boolean
+        Whether to include fields defined in WFS only, not in the
+        default dataframe for this type.
+
+    Returns
+    -------
+    tuple<str>
+        Tuple of the field names of this type.
+
+    Raises
+    ------
+    pydov.util.errors.InvalidFieldError
+        If at least one of the fields listed in `return_fields` is unknown.
+
+    """
+    if return_fields is None:
+        if include_wfs_injected:
+            fields = [f['name'] for f in cls.fields]
+        else:
+            fields = [f['name'] for f in cls.fields if not f.get(
+                'wfs_injected', False)]
+        if include_subtypes:
+            for st in cls.subtypes:
+                fields.extend(st.get_field_names())
+    else:
+        cls_fields = [f['name'] for f in cls.fields]
+        if include_subtypes:
+            for st in cls.subtypes:
+                cls_fields.extend(st.get_field_names())
+
+        cls_fields = set(cls_fields)
+        fields = [f for f in return_fields if f in cls_fields]
+
+        for rf in return_fields:
+            if rf not in cls_fields:
+                raise InvalidFieldError(
+                    "Unknown return field: '{}'".format(rf))
+    return tuple(fields)
+
+
+@lru_cache(maxsize=None)
+def _get_default_subtype_data(cls):
+    """Return the default data dictionary of the given subtype class,
+    with all fields unresolved.
+
+    Cached per class: instances copy this template instead of rebuilding
+    it on every initialisation.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovSubType
+        Subtype class to build the default data dictionary of.
+
+    Returns
+    -------
+    dict<str,str>
+        Dictionary mapping each field name to the unresolved marker.
+
+    """
+    return {name: AbstractDovSubType._UNRESOLVED
+            for name in _get_subtype_field_names(cls)}
+
+
+@lru_cache(maxsize=None)
+def _get_default_type_data(cls):
+    """Return the default data dictionary of the given type class, with
+    all fields unresolved.
+
+    Cached per class: instances copy this template instead of rebuilding
+    it on every initialisation.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovType
+        Type class to build the default data dictionary of.
+
+    Returns
+    -------
+    dict<str,str>
+        Dictionary mapping each field name to the unresolved marker.
+
+    """
+    return {name: AbstractDovType._UNRESOLVED
+            for name in cls.get_field_names(include_subtypes=False)}
+
+
+@lru_cache(maxsize=None)
+def _get_type_fields(cls, source, include_subtypes):
+    """Return the field metadata of the given type class.
+
+    Cached per class and argument combination; clear_caches()
+    invalidates the cache whenever the fields of a type are changed
+    at runtime.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovType
+        Type class to list the fields of.
+    source : str or tuple<str>
+        Sources to include in the output. Can be a combination of one or
+        more of `wfs`, `xml` or `custom`.
+    include_subtypes : boolean
+        Whether to include fields defined in subtypes (True) or not (False).
+
+    Returns
+    -------
+    collections.OrderedDict<str,dict>
+        Ordered dictionary mapping the field (column) name to the
+        dictionary containing the metadata of this field.
+
+    """
+    fields = OrderedDict(
+        zip([f['name'] for f in cls.fields if f['source'] in source],
+            [f for f in cls.fields if f['source'] in source]))
+
+    if include_subtypes and 'xml' in source:
+        for st in cls.subtypes:
+            fields.update(st.get_fields())
+
+    return fields
+
+
+@lru_cache(maxsize=None)
+def _get_wfs_field_specs(cls):
+    """Return the WFS field parse specifications of the given type class.
+
+    Cached per class, so the field metadata is distilled only once
+    instead of for every feature in a WFS response; clear_caches()
+    invalidates the cache whenever the fields of a type are changed at
+    runtime.
+
+    Parameters
+    ----------
+    cls : subclass of AbstractDovType
+        Type class to list the WFS fields of.
+
+    Returns
+    -------
+    tuple<tuple<str,str,function>>
+        Tuple of (name, sourcefield, converter) tuples, one for each
+        field of this type with source `wfs`. The converter parses a
+        text value into the datatype of the field.
+
+    """
+    return tuple(
+        (field['name'], field['sourcefield'],
+         _typeconverters.get(field.get('type', None), _typeconvert_default))
+        for field in _get_type_fields(cls, ('wfs',), True).values())
+
+
+__cached_helpers = (_get_subtype_field_names,
+                    _get_subtype_fields,
+                    _get_subtype_field_specs,
+                    _get_type_field_names,
+                    _get_default_subtype_data,
+                    _get_default_type_data,
+                    _get_type_fields,
+                    _get_wfs_field_specs)
+
+
+def clear_caches():
+    """Clear the cached field metadata of all types and subtypes.
+
+    Must be called whenever the fields of a type are changed at runtime,
+    e.g. when a search class injects WFS-only fields, so subsequent
+    lookups cannot serve stale field metadata.
+    """
+    for helper in __cached_helpers:
+        helper.cache_clear()
+
+
 class AbstractTypeCommon(AbstractCommon):
     """Class grouping methods common to AbstractDovType and
     AbstractDovSubType.
@@ -57,11 +378,7 @@ class AbstractTypeCommon(AbstractCommon):
             `xpath`, converted to the type described by `returntype`.
 
         """
-        if namespace is not None:
-            ns = '{{{}}}'.format(namespace)
-            text = func('./' + ns + ('/' + ns).join(xpath.split('/')))
-        else:
-            text = func('./' + xpath.lstrip('/'))
+        text = func(_build_xpath(xpath, namespace))
 
         if text is None:
             return np.nan
@@ -127,10 +444,7 @@ class AbstractDovSubType(AbstractTypeCommon):
                     "pydov.types.fields.AbstractField, found {}.".format(
                         self.__class__.__name__, str(type(f))))
 
-        self.data = dict(
-            zip(self.get_field_names(),
-                [AbstractDovSubType._UNRESOLVED] * len(self.get_field_names()))
-        )
+        self.data = _get_default_subtype_data(type(self)).copy()
 
     @classmethod
     def from_xml(cls, xml_data):
@@ -138,9 +452,9 @@ class AbstractDovSubType(AbstractTypeCommon):
 
         Parameters
         ----------
-        xml_data : bytes
+        xml_data : bytes or etree.Element
             Raw XML data of the DOV object that contains information about
-            this subtype.
+            this subtype, or an already parsed XML tree thereof.
 
         Yields
         ------
@@ -149,7 +463,10 @@ class AbstractDovSubType(AbstractTypeCommon):
 
         """
         try:
-            tree = parse_dov_xml(xml_data)
+            if isinstance(xml_data, (bytes, str)):
+                tree = parse_dov_xml(xml_data)
+            else:
+                tree = xml_data
             for element in tree.findall(cls.rootpath):
                 yield cls.from_xml_element(element)
         except XmlParseError:
@@ -176,13 +493,10 @@ class AbstractDovSubType(AbstractTypeCommon):
         """
         instance = cls()
 
-        for field in cls.get_fields().values():
-            instance.data[field['name']] = instance._parse(
-                func=element.findtext,
-                xpath=field['sourcefield'],
-                namespace=None,
-                returntype=field.get('type', None)
-            )
+        for name, sourcefield, converter in _get_subtype_field_specs(cls):
+            text = element.findtext(_build_xpath(sourcefield, None))
+            instance.data[name] = \
+                np.nan if text is None else converter(text)
 
         return instance
 
@@ -197,7 +511,7 @@ class AbstractDovSubType(AbstractTypeCommon):
             the names of the columns in the output dataframe for this type.
 
         """
-        return [f['name'] for f in cls.fields]
+        return list(_get_subtype_field_names(cls))
 
     @classmethod
     def get_fields(cls):
@@ -232,9 +546,7 @@ class AbstractDovSubType(AbstractTypeCommon):
                 Whether the field is mandatory (True) or can be null (False).
 
         """
-        return OrderedDict(
-            zip([f['name'] for f in cls.fields],
-                [f for f in cls.fields]))
+        return OrderedDict(_get_subtype_fields(cls))
 
     @classmethod
     def get_name(cls):
@@ -299,15 +611,9 @@ class AbstractDovType(AbstractTypeCommon):
                     "pydov.types.fields.AbstractField, found {}.".format(
                         self.__class__.__name__, str(type(f))))
 
-        self.data = dict(
-            zip(self.get_field_names(include_subtypes=False),
-                [AbstractDovType._UNRESOLVED] * len(self.get_field_names()))
-        )
+        self.data = _get_default_type_data(type(self)).copy()
 
-        self.subdata = dict(
-            zip([st.get_name() for st in self.subtypes],
-                [] * len(self.subtypes))
-        )
+        self.subdata = {st.get_name(): [] for st in self.subtypes}
 
         self.data['pkey_{}'.format(self.typename)] = self.pkey
 
@@ -347,7 +653,7 @@ class AbstractDovType(AbstractTypeCommon):
                     returntype=field.get('type', None)
                 )
 
-            self._parse_subtypes(xml)
+            self._parse_subtypes(tree)
             return True
         except XmlParseError:
             warnings.warn(
@@ -381,15 +687,18 @@ class AbstractDovType(AbstractTypeCommon):
 
         """
         instance = cls(feature.findtext(
-            './{{{}}}{}'.format(namespace, cls.pkey_fieldname)))
+            _build_xpath(cls.pkey_fieldname, namespace)))
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            instance.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+        values = _extract_feature_values(feature)
+        ns = '{{{}}}'.format(namespace) if namespace is not None else ''
+
+        for name, sourcefield, converter in _get_wfs_field_specs(cls):
+            if '/' in sourcefield:
+                text = feature.findtext(_build_xpath(sourcefield, namespace))
+            else:
+                text = values.get(ns + sourcefield)
+            instance.data[name] = \
+                np.nan if text is None else converter(text)
 
         return instance
 
@@ -471,31 +780,16 @@ class AbstractDovType(AbstractTypeCommon):
             If at least one of the fields listed in `return_fields` is unknown.
 
         """
-        if return_fields is None:
-            if include_wfs_injected:
-                fields = [f['name'] for f in cls.fields]
-            else:
-                fields = [f['name'] for f in cls.fields if not f.get(
-                    'wfs_injected', False)]
-            if include_subtypes:
-                for st in cls.subtypes:
-                    fields.extend(st.get_field_names())
-        elif type(return_fields) not in (list, tuple, set):
+        if return_fields is not None \
+                and type(return_fields) not in (list, tuple, set):
             raise AttributeError(
                 'return_fields should be a list, tuple or set')
-        else:
-            cls_fields = [f['name'] for f in cls.fields]
-            if include_subtypes:
-                for st in cls.subtypes:
-                    cls_fields.extend(st.get_field_names())
 
-            fields = [f for f in return_fields if f in cls_fields]
+        if return_fields is not None:
+            return_fields = tuple(return_fields)
 
-            for rf in return_fields:
-                if rf not in cls_fields:
-                    raise InvalidFieldError(
-                        "Unknown return field: '{}'".format(rf))
-        return fields
+        return list(_get_type_field_names(
+            cls, return_fields, include_subtypes, include_wfs_injected))
 
     @classmethod
     def get_fields(cls, source=('wfs', 'xml'), include_subtypes=True):
@@ -546,15 +840,10 @@ class AbstractDovType(AbstractTypeCommon):
                 Whether the field is mandatory (True) or can be null (False).
 
         """
-        fields = OrderedDict(
-            zip([f['name'] for f in cls.fields if f['source'] in source],
-                [f for f in cls.fields if f['source'] in source]))
+        if not isinstance(source, str):
+            source = tuple(source)
 
-        if include_subtypes and 'xml' in source:
-            for st in cls.subtypes:
-                fields.update(st.get_fields())
-
-        return fields
+        return OrderedDict(_get_type_fields(cls, source, include_subtypes))
 
     @classmethod
     def get_xsd_schemas(cls):
@@ -650,8 +939,9 @@ class AbstractDovType(AbstractTypeCommon):
 
         Parameters
         ----------
-        xml : bytes
-            The raw XML data of the DOV object as bytes.
+        xml : bytes or etree.Element
+            The raw XML data of the DOV object as bytes, or an already
+            parsed XML tree thereof.
 
         """
         for subtype in self.subtypes:
@@ -693,30 +983,36 @@ class AbstractDovType(AbstractTypeCommon):
         if len(subfields) > 0:
             parsed = self._parse_xml_data(session)
 
-        datadicts = []
-        datarecords = []
+        subfield_positions = [(i, field) for i, field in enumerate(fields)
+                              if field in subfields]
 
-        if len(self.subdata) == 0 or len(subfields) == 0:
-            datadicts.append(self.data)
-        else:
-            for subtype in self.subdata:
-                if len(self.subdata[subtype]) == 0:
-                    datadicts.append(self.data)
-                else:
-                    for subdata in self.subdata[subtype]:
-                        datadict = {}
-                        datadict.update(self.data)
-                        datadict.update(subdata.data)
-                        datadicts.append(datadict)
-
-        for d in datadicts:
-            datarecords.append([d.get(field, np.nan) for field in fields])
-
-        for d in datarecords:
-            if parsed is None and self._UNRESOLVED in d:
-                parsed = self._parse_xml_data(session)
-                if parsed is True:
-                    datarecords = self.get_df_array(return_fields)
+        def build_datarecords():
+            """Build the list of datarecords from the (sub)data currently
+            resolved, one record per subdata row."""
+            base_record = [self.data.get(field, np.nan) for field in fields]
+            datarecords = []
+
+            if len(self.subdata) == 0 or len(subfields) == 0:
+                datarecords.append(base_record)
+            else:
+                for subtype in self.subdata:
+                    if len(self.subdata[subtype]) == 0:
+                        datarecords.append(list(base_record))
+                    else:
+                        for subdata in self.subdata[subtype]:
+                            record = list(base_record)
+                            for i, field in subfield_positions:
+                                record[i] = subdata.data.get(field, np.nan)
+                            datarecords.append(record)
+
+            return datarecords
+
+        datarecords = build_datarecords()
+
+        if parsed is None and \
+                any(self._UNRESOLVED in d for d in datarecords):
+            if self._parse_xml_data(session):
+                datarecords = build_datarecords()
 
         return [[c if c != self._UNRESOLVED else np.nan for c in r]
                 for r in datarecords]
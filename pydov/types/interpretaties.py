@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 """Module containing the DOV data types for interpretations, including
 subtypes."""
-import numpy as np
-
-from pydov.types.abstract import AbstractDovSubType, AbstractDovType
+from pydov.types.abstract import (AbstractDovSubType, AbstractDovType,
+                                  _build_xpath,
+                                  _extract_feature_values,
+                                  _get_wfs_field_specs)
 from pydov.types.fields import WfsField, XmlField, XsdType, _CustomField
 from pydov.util.dovutil import build_dov_url
 
+# local NaN constant: cheaper to reference in the parse loops than the
+# numpy attribute and equal to numpy's nan for all practical purposes
+_NAN = float('nan')
+
 
 class AbstractCommonInterpretatie(AbstractDovType):
     """Abstract base class for interpretations that can be linked to
@@ -53,46 +58,38 @@ class AbstractCommonInterpretatie(AbstractDovType):
     @classmethod
     def from_wfs_element(cls, feature, namespace):
         instance = cls(
-            feature.findtext('./{{{}}}{}'.format(
-                namespace, cls.pkey_fieldname)))
-
-        typeproef = cls._parse(
-            func=feature.findtext,
-            xpath='Type_proef',
-            namespace=namespace,
-            returntype='string'
-        )
-
-        if typeproef == 'Boring':
-            instance.data['pkey_boring'] = cls._parse(
-                func=feature.findtext,
-                xpath='Proeffiche',
-                namespace=namespace,
-                returntype='string'
-            )
-            instance.data['pkey_sondering'] = np.nan
-        elif typeproef == 'Sondering':
-            instance.data['pkey_sondering'] = cls._parse(
-                func=feature.findtext,
-                xpath='Proeffiche',
-                namespace=namespace,
-                returntype='string'
-            )
-            instance.data['pkey_boring'] = np.nan
-        else:
-            instance.data['pkey_boring'] = np.nan
-            instance.data['pkey_sondering'] = np.nan
-
-        for field in cls.get_fields(source=('wfs',)).values():
-            if field['name'] in ['pkey_boring', 'pkey_sondering']:
-                continue
-
-            instance.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+            feature.findtext(_build_xpath(cls.pkey_fieldname, namespace)))
+
+        values = _extract_feature_values(feature)
+        ns = '{{{}}}'.format(namespace) if namespace is not None else ''
+
+        for name, sourcefield, converter in _get_wfs_field_specs(cls):
+            if '/' in sourcefield:
+                text = feature.findtext(_build_xpath(sourcefield, namespace))
+            else:
+                text = values.get(ns + sourcefield)
+            instance.data[name] = \
+                _NAN if text is None else converter(text)
+
+        # pkey_boring and pkey_sondering are custom fields, resolved from
+        # the Proeffiche depending on the type of the linked proef
+        typeproef = values.get(ns + 'Type_proef')
+        typeproef = typeproef.strip() if typeproef is not None else None
+
+        pkey_boring = pkey_sondering = _NAN
+        if typeproef in ('Boring', 'Sondering'):
+            proeffiche = values.get(ns + 'Proeffiche')
+            if proeffiche is not None:
+                proeffiche = proeffiche.strip()
+            else:
+                proeffiche = _NAN
+            if typeproef == 'Boring':
+                pkey_boring = proeffiche
+            else:
+                pkey_sondering = proeffiche
+
+        instance.data['pkey_boring'] = pkey_boring
+        instance.data['pkey_sondering'] = pkey_sondering
 
         return instance
 
@@ -132,16 +129,18 @@ class AbstractBoringInterpretatie(AbstractDovType):
     @classmethod
     def from_wfs_element(cls, feature, namespace):
         instance = cls(
-            feature.findtext('./{{{}}}{}'.format(
-                namespace, cls.pkey_fieldname)))
-
-        for field in cls.get_fields(source=('wfs',)).values():
-            instance.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+            feature.findtext(_build_xpath(cls.pkey_fieldname, namespace)))
+
+        values = _extract_feature_values(feature)
+        ns = '{{{}}}'.format(namespace) if namespace is not None else ''
+
+        for name, sourcefield, converter in _get_wfs_field_specs(cls):
+            if '/' in sourcefield:
+                text = feature.findtext(_build_xpath(sourcefield, namespace))
+            else:
+                text = values.get(ns + sourcefield)
+            instance.data[name] = \
+                _NAN if text is None else converter(text)
 
         return instance
 
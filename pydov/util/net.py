@@ -11,6 +11,8 @@ from requests.adapters import HTTPAdapter
 import pydov
 
 request_timeout = 300
+request_pool_workers = 4
+request_pool_maxsize = 32
 
 
 class TimeoutHTTPAdapter(HTTPAdapter):
@@ -79,7 +81,9 @@ class SessionFactory:
                     ['HEAD', 'GET', 'POST', 'PUT', 'OPTIONS']))
 
         adapter = TimeoutHTTPAdapter(timeout=request_timeout,
-                                     max_retries=retry)
+                                     max_retries=retry,
+                                     pool_connections=request_pool_maxsize,
+                                     pool_maxsize=request_pool_maxsize)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
         return session
@@ -90,7 +94,7 @@ class LocalSessionThreadPool:
     in parallel.
     """
 
-    def __init__(self, workers=4):
+    def __init__(self, workers=None):
         """Initialisation.
 
         Set up the pool and start all workers.
@@ -98,8 +102,12 @@ class LocalSessionThreadPool:
         Parameters
         ----------
         workers : int, optional
-            Number of worker threads to use, defaults to 4.
+            Number of worker threads to use, defaults to
+            pydov.util.net.request_pool_workers.
         """
+        if workers is None:
+            workers = request_pool_workers
+
         self.workers = []
         self.input_queue = Queue(maxsize=100)
         self.result_queue = Queue()
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Module grouping utility functions for OWS services."""
 import warnings
+from functools import lru_cache
+from io import BytesIO
 from urllib.parse import urlparse
 
 from owslib.etree import etree
@@ -26,11 +28,36 @@ def __get_namespaces():
 
 __namespaces = __get_namespaces()
 
-
+# namespace-resolved element tags and paths used when parsing feature
+# catalogues, resolved once at import time instead of per call or per
+# attribute
+__fc_tag = nspath_eval('gfc:FC_FeatureCatalogue', __namespaces)
+__fc_featuretype_tag = nspath_eval('gfc:FC_FeatureType', __namespaces)
+__fc_attribute_tag = nspath_eval('gfc:FC_FeatureAttribute', __namespaces)
+__fc_attr_name_path = nspath_eval(
+    'gfc:memberName/gco:LocalName', __namespaces)
+__fc_attr_definition_path = nspath_eval(
+    'gfc:definition/gco:CharacterString', __namespaces)
+__fc_attr_lower_path = nspath_eval(
+    'gfc:cardinality/gco:Multiplicity/gco:range/gco:MultiplicityRange/'
+    'gco:lower/gco:Integer', __namespaces)
+__fc_attr_upper_path = nspath_eval(
+    'gfc:cardinality/gco:Multiplicity/gco:range/gco:MultiplicityRange/'
+    'gco:upper/gco:UnlimitedInteger', __namespaces)
+__fc_attr_values_path = nspath_eval(
+    'gfc:listedValue/gfc:FC_ListedValue', __namespaces)
+__fc_value_label_path = nspath_eval(
+    'gfc:label/gco:CharacterString', __namespaces)
+
+
+@lru_cache(maxsize=128)
 def __get_remote_fc(fc_url):
     """Request the remote featurecatalogue by calling the `fc_url` and
     returning the response.
 
+    Responses are cached by URL for the lifetime of the process, as the
+    same feature catalogue is often requested for multiple layers.
+
     Parameters
     ----------
     fc_url : str
@@ -45,10 +72,15 @@ def __get_remote_fc(fc_url):
     return get_url(fc_url)
 
 
+@lru_cache(maxsize=128)
 def __get_remote_describefeaturetype(describefeaturetype_url):
     """Request the remote DescribeFeatureType by calling the
     `describefeaturetype_url` and returning the response.
 
+    Responses are cached by URL for the lifetime of the process, as the
+    same schema is requested both for the namespace and for the fields
+    of a layer.
+
     Parameters
     ----------
     describefeaturetype_url : str
@@ -63,6 +95,53 @@ def __get_remote_describefeaturetype(describefeaturetype_url):
     return get_url(describefeaturetype_url)
 
 
+# keep references to the cached helpers: tests monkeypatch the module
+# attributes, but clear_caches() should always clear the real caches
+__cached_helpers = (__get_remote_fc, __get_remote_describefeaturetype)
+
+# caches of parsed metadata and feature catalogues: caching the parsed
+# objects instead of the raw bytes amortizes the XML parsing too
+_md_cache = {}
+_fc_cache = {}
+
+
+def clear_caches():
+    """Clear the caches of remote OWS responses.
+
+    Subsequent calls will re-request and re-parse the documents from the
+    remote services.
+    """
+    for helper in __cached_helpers:
+        helper.cache_clear()
+    __get_namespace.cache_clear()
+    _md_cache.clear()
+    _fc_cache.clear()
+
+
+def __find_getrecordbyid_url(contentmetadata):
+    """Scan the metadata URLs of the given layer for a GetRecordById URL.
+
+    Parameters
+    ----------
+    contentmetadata : owslib.feature.wfs110.ContentMetadata
+        Content metadata associated with a WFS layer, containing the
+        associated `metadataUrls`.
+
+    Returns
+    -------
+    str or None
+        The last GetRecordById URL associated with the layer, or None if
+        there is none.
+
+    """
+    md_url = None
+    for md in contentmetadata.metadataUrls:
+        url = md.get('url', None)
+        if url is not None and 'getrecordbyid' in url.lower():
+            md_url = url
+    return md_url
+
+
 def get_remote_metadata(contentmetadata):
     """Request and parse the remote metadata associated with the layer
     described in `contentmetadata`.
@@ -85,12 +164,21 @@ def get_remote_metadata(contentmetadata):
         If the `contentmetadata` has no valid metadata URL associated with it.
 
     """
+    cache_key = tuple(sorted(
+        md['url'] for md in contentmetadata.metadataUrls
+        if md.get('url', None) is not None))
+
+    if len(cache_key) > 0 and cache_key in _md_cache:
+        return _md_cache[cache_key]
+
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=FutureWarning)
         contentmetadata.parse_remote_metadata(pydov.util.net.request_timeout)
 
     for remote_md in contentmetadata.metadataUrls:
         if 'metadata' in remote_md:
+            if len(cache_key) > 0:
+                _md_cache[cache_key] = remote_md['metadata']
             return remote_md['metadata']
 
     raise MetadataNotFoundError
@@ -117,11 +205,7 @@ def get_csw_base_url(contentmetadata):
         If the `contentmetadata` has no valid metadata URL associated with it.
 
     """
-    md_url = None
-    for md in contentmetadata.metadataUrls:
-        if md.get('url', None) is not None \
-                and 'getrecordbyid' in md.get('url', "").lower():
-            md_url = md.get('url')
+    md_url = __find_getrecordbyid_url(contentmetadata)
 
     if md_url is None:
         raise MetadataNotFoundError
@@ -201,78 +285,115 @@ def get_remote_featurecatalogue(csw_url, fc_uuid):
         given CSW service.
 
     """
+    if (csw_url, fc_uuid) in _fc_cache:
+        return _fc_cache[(csw_url, fc_uuid)]
+
     fc_url = csw_url + '?Service=CSW&Request=GetRecordById&Version=2.0.2' \
                        '&outputSchema=http://www.isotc211.org/2005/gfc' \
                        '&elementSetName=full&id=' + fc_uuid
 
     content = __get_remote_fc(fc_url)
-    tree = etree.fromstring(content)
 
-    fc = tree.find(nspath_eval('gfc:FC_FeatureCatalogue', __namespaces))
-    if fc is None:
+    # parse the document incrementally: attributes are processed and
+    # cleared as soon as their closing tag is seen, so the full tree is
+    # never materialized in memory
+    fc_found = False
+    fc_definition = None
+    attributes = {}
+
+    for _, elem in etree.iterparse(BytesIO(content), events=('end',)):
+        if elem.tag == __fc_attribute_tag:
+            a = elem
+            attr = {}
+            name = a.findtext(__fc_attr_name_path)
+            attr['definition'] = a.findtext(__fc_attr_definition_path)
+
+            try:
+                multiplicity_lower = int(a.findtext(__fc_attr_lower_path))
+            except (TypeError, ValueError):
+                multiplicity_lower = 0
+
+            upper = a.find(__fc_attr_upper_path)
+
+            try:
+                multiplicity_upper = int(upper.text)
+            except (TypeError, ValueError):
+                multiplicity_upper = None
+
+            if upper.get('isInfinite', 'false').lower() == 'true':
+                multiplicity_upper = 'Inf'
+
+            values = {}
+            for lv in a.findall(__fc_attr_values_path):
+                label = lv.findtext(__fc_value_label_path)
+                definition = lv.findtext(__fc_attr_definition_path)
+
+                if label is not None:
+                    label = label.strip()
+                    if label != '':
+                        if definition is not None:
+                            values[label] = definition.strip() if \
+                                definition.strip() != '' else None
+                        else:
+                            values[label] = None
+
+            attr['values'] = values if len(values) > 0 else None
+
+            attr['multiplicity'] = (multiplicity_lower, multiplicity_upper)
+            attributes[name] = attr
+            elem.clear()
+        elif elem.tag == __fc_featuretype_tag:
+            fc_definition = elem.findtext(__fc_attr_definition_path)
+            elem.clear()
+        elif elem.tag == __fc_tag:
+            fc_found = True
+
+    if not fc_found:
         raise FeatureCatalogueNotFoundError
 
     r = {}
-    r['definition'] = fc.findtext(nspath_eval(
-        'gfc:featureType/gfc:FC_FeatureType/gfc:definition/'
-        'gco:CharacterString', __namespaces))
-
-    attributes = {}
-    for a in fc.findall(nspath_eval(
-            'gfc:featureType/gfc:FC_FeatureType/gfc:carrierOfCharacteristics/'
-            'gfc:FC_FeatureAttribute', __namespaces)):
-        attr = {}
-        name = a.findtext(
-            nspath_eval('gfc:memberName/gco:LocalName', __namespaces))
-        attr['definition'] = a.findtext(nspath_eval(
-            'gfc:definition/gco:CharacterString', __namespaces))
-
-        try:
-            multiplicity_lower = int(a.findtext(nspath_eval(
-                'gfc:cardinality/gco:Multiplicity/gco:range/gco'
-                ':MultiplicityRange/gco:lower/gco:Integer', __namespaces)))
-        except (TypeError, ValueError):
-            multiplicity_lower = 0
-
-        upper = a.find(nspath_eval(
-            'gfc:cardinality/gco:Multiplicity/gco:range/gco'
-            ':MultiplicityRange/gco:upper/gco:UnlimitedInteger',
-            __namespaces))
-
-        try:
-            multiplicity_upper = int(upper.text)
-        except (TypeError, ValueError):
-            multiplicity_upper = None
-
-        if upper.get('isInfinite', 'false').lower() == 'true':
-            multiplicity_upper = 'Inf'
-
-        values = {}
-        for lv in a.findall(nspath_eval('gfc:listedValue/gfc:FC_ListedValue',
-                                        __namespaces)):
-            label = lv.findtext(nspath_eval('gfc:label/gco:CharacterString',
-                                            __namespaces))
-            definition = lv.findtext(nspath_eval(
-                'gfc:definition/gco:CharacterString', __namespaces))
-
-            if label is not None:
-                label = label.strip()
-                if label != '':
-                    if definition is not None:
-                        values[label] = definition.strip() if \
-                            definition.strip() != '' else None
-                    else:
-                        values[label] = None
-
-        attr['values'] = values if len(values) > 0 else None
-
-        attr['multiplicity'] = (multiplicity_lower, multiplicity_upper)
-        attributes[name] = attr
-
+    r['definition'] = fc_definition
     r['attributes'] = attributes
+    _fc_cache[(csw_url, fc_uuid)] = r
     return r
 
 
+@lru_cache(maxsize=64)
+def __get_namespace(url, layer):
+    """Request the namespace associated with a layer by performing a
+    DescribeFeatureType request.
+
+    Cached per (url, layer) pair, as the namespace of a layer never
+    changes within a session; this also avoids re-parsing the schema
+    when the raw response was already cached.
+
+    Parameters
+    ----------
+    url : str
+        URL of the WFS service associated with the layer.
+    layer : str
+        Workspace-qualified name of the layer to get the namespace of (
+        typename).
+
+    Returns
+    -------
+    namespace : str
+        URI of the namespace associated with the given layer.
+
+    """
+    from owslib.feature.schema import _get_describefeaturetype_url
+    describefeaturetype_url = _get_describefeaturetype_url(
+        url=url, version='1.1.0', typename=layer)
+    schema = __get_remote_describefeaturetype(describefeaturetype_url)
+
+    # the namespace is an attribute of the root element: parse the schema
+    # incrementally and stop at the first start tag instead of
+    # materializing the full document
+    for _, elem in etree.iterparse(BytesIO(schema), events=('start',)):
+        return elem.attrib.get('targetNamespace', None)
+    return None
+
+
 def get_namespace(wfs, layer):
     """Request the namespace associated with a layer by performing a
     DescribeFeatureType request.
@@ -291,13 +412,7 @@ def get_namespace(wfs, layer):
         URI of the namespace associated with the given layer.
 
     """
-    from owslib.feature.schema import _get_describefeaturetype_url
-    url = _get_describefeaturetype_url(url=wfs.url, version='1.1.0',
-                                       typename=layer)
-    schema = __get_remote_describefeaturetype(url)
-    tree = etree.fromstring(schema)
-    namespace = tree.attrib.get('targetNamespace', None)
-    return namespace
+    return __get_namespace(wfs.url, layer)
 
 
 def set_geometry_column(location, geometry_column):
@@ -18,6 +18,41 @@ from pydov.util.errors import InvalidFieldError
 from pydov.util.location import Box, Within
 from pydov.util.query import Join, PropertyInList
 
+_re_clean_xml = re.compile(
+    r'(?P<xmlns>[ ]+xmlns:[^=]+="[^"]+")'
+    r'|<(?P<slash>/?)[^:]+:(?P<tag>[^ >]+)(?=[ >])'
+    r'|(?P<tagspace>[ ]+/>)'
+    r'|(?P<intertag>>[ ]+(?=<))')
+
+
+def _clean_xml_repl(match):
+    """Return the replacement for a single clean_xml match.
+
+    Parameters
+    ----------
+    match : re.Match
+        Match of one of the _re_clean_xml alternatives.
+
+    Returns
+    -------
+    str
+        Replacement string for the matched alternative.
+
+    """
+    group = match.lastgroup
+    if group == 'xmlns':
+        # remove xmlns namespace definitions
+        return ''
+    elif group == 'tag':
+        # remove namespace prefixes in tags
+        return '<{}{}'.format(match.group('slash'), match.group('tag'))
+    elif group == 'tagspace':
+        # remove extra spaces in tags
+        return '/>'
+    else:
+        # remove extra spaces between tags
+        return '>'
+
 
 class ServiceCheck:
 
@@ -79,19 +114,7 @@ def clean_xml(xml):
         String representation of cleaned XML document.
 
     """
-    # remove xmlns namespace definitions
-    r = re.sub(r'[ ]+xmlns:[^=]+="[^"]+"', '', xml)
-
-    # remove namespace prefixes in tags
-    r = re.sub(r'<(/?)[^:]+:([^ >]+)([ >])', r'<\1\2\3', r)
-
-    # remove extra spaces in tags
-    r = re.sub(r'[ ]+/>', '/>', r)
-
-    # remove extra spaces between tags
-    r = re.sub(r'>[ ]+<', '><', r)
-
-    return r
+    return _re_clean_xml.sub(_clean_xml_repl, xml)
 
 
 class AbstractTestSearch(object):
@@ -122,8 +145,8 @@ class AbstractTestSearch(object):
     valid_returnfields_extra : tuple of str
             A tuple containing valid return fields, including extra fields
             from WFS, not present in the default dataframe.
-    df_default_columns : list of str
-            A list of the column names of the default dataframe.
+    df_default_columns : tuple of str
+            A tuple of the column names of the default dataframe.
 
     """
 
@@ -237,6 +260,7 @@ class AbstractTestSearch(object):
 
         assert isinstance(df, DataFrame)
 
+    @pytest.mark.slow
     def test_search(self, mp_wfs, mp_get_schema, mp_remote_describefeaturetype,
                     mp_remote_md, mp_remote_fc, mp_remote_wfs_feature,
                     mp_dov_xml):
@@ -267,28 +291,34 @@ class AbstractTestSearch(object):
 
         assert isinstance(df, DataFrame)
 
-        assert list(df) == self.df_default_columns
+        assert list(df) == list(self.df_default_columns)
 
         datatype = self.datatype_class
         allfields = datatype.get_field_names()
-        ownfields = datatype.get_field_names(include_subtypes=False)
-        subfields = [f for f in allfields if f not in ownfields]
+        ownfields = frozenset(datatype.get_field_names(include_subtypes=False))
+        subfields = frozenset(allfields).difference(ownfields)
 
         assert len(df) >= 1
 
+        # count the unique values of all columns in a single pass
+        nunique = df.nunique(dropna=False)
+
         for field in list(df):
             if field in ownfields:
-                assert len(df[field].unique()) == 1
+                assert nunique[field] == 1
             elif field in subfields:
-                assert len(df[field].unique()) >= 1
+                assert nunique[field] >= 1
 
         # dtype checks of the resulting df columns
         fields = self.search_instance.get_fields()
 
+        # count the non-null values of all columns in a single pass
+        notnull_count = df.count()
+
         for field in list(df):
             mandatory = fields[field]['notnull']
             if mandatory:
-                assert len(df[field]) == len(df[field].dropna())
+                assert notnull_count[field] == len(df)
 
         for field in list(df):
             field_datatype = fields[field]['type']
@@ -378,62 +408,55 @@ class AbstractTestSearch(object):
         assert isinstance(df, DataFrame)
         assert list(df) == rf
 
-    def test_search_wrongreturnfields(self):
-        """Test the search method with the query parameter and an inexistent
-        return field.
-
-        Test whether an InvalidFieldError is raised.
-
-        """
-        return_fields = list(self.valid_returnfields)
-        return_fields.append(self.inexistent_field)
-
-        with pytest.raises(InvalidFieldError):
-            self.search_instance.search(
-                query=self.valid_query_single,
-                return_fields=return_fields)
+    @pytest.mark.parametrize('case', ['wrongreturnfields',
+                                      'wrongreturnfieldstype',
+                                      'query_wrongfield',
+                                      'query_wrongfield_returnfield'])
+    def test_search_wrongfields(self, case):
+        """Test the search method with an invalid query or return field.
 
-    def test_search_wrongreturnfieldstype(self):
-        """Test the search method with the query parameter and a single
-        return field as string.
+        Test whether the appropriate error is raised for each case: an
+        inexistent return field, a single return field passed as string,
+        an inexistent query field and an XML (return-only) query field.
 
-        Test whether an AttributeError is raised.
+        Parameters
+        ----------
+        case : str
+            The invalid field scenario to test.
 
         """
-        with pytest.raises(AttributeError):
-            self.search_instance.search(
-                query=self.valid_query_single,
-                return_fields=self.valid_returnfields[0])
+        if case == 'wrongreturnfields':
+            return_fields = list(self.valid_returnfields)
+            return_fields.append(self.inexistent_field)
 
-    def test_search_query_wrongfield(self):
-        """Test the search method with the query parameter using an
-        inexistent query field.
+            with pytest.raises(InvalidFieldError):
+                self.search_instance.search(
+                    query=self.valid_query_single,
+                    return_fields=return_fields)
 
-        Test whether an InvalidFieldError is raised.
+        elif case == 'wrongreturnfieldstype':
+            with pytest.raises(AttributeError):
+                self.search_instance.search(
+                    query=self.valid_query_single,
+                    return_fields=self.valid_returnfields[0])
 
-        """
-        query = PropertyIsEqualTo(propertyname=self.inexistent_field,
-                                  literal='The cat is out of the bag.')
+        elif case == 'query_wrongfield':
+            query = PropertyIsEqualTo(propertyname=self.inexistent_field,
+                                      literal='The cat is out of the bag.')
 
-        with pytest.raises(InvalidFieldError):
-            self.search_instance.search(
-                query=query)
+            with pytest.raises(InvalidFieldError):
+                self.search_instance.search(
+                    query=query)
 
-    def test_search_query_wrongfield_returnfield(self):
-        """Test the search method with the query parameter using an
-        return-only field as query field.
+        elif case == 'query_wrongfield_returnfield':
+            if self.xml_field is None:
+                return
 
-        Test whether an InvalidFieldError is raised.
+            query = PropertyIsEqualTo(propertyname=self.xml_field,
+                                      literal='Geotechnisch onderzoek')
 
-        """
-        if self.xml_field is None:
-            return
-
-        query = PropertyIsEqualTo(propertyname=self.xml_field,
-                                  literal='Geotechnisch onderzoek')
-
-        with pytest.raises(InvalidFieldError):
-            self.search_instance.search(query=query)
+            with pytest.raises(InvalidFieldError):
+                self.search_instance.search(query=query)
 
     def test_search_extrareturnfields(self, mp_get_schema,
                                       mp_remote_describefeaturetype,
@@ -830,9 +853,11 @@ class AbstractTestTypes(object):
         if self.field_names_subtypes is None:
             return
 
+        subtype_fields = frozenset(self.field_names_subtypes)
+
         fields = self.datatype_class.get_fields(include_subtypes=False)
         for field in fields:
-            assert field not in self.field_names_subtypes
+            assert field not in subtype_fields
 
     def test_from_wfs_element(self, wfs_feature):
         """Test the from_wfs_element method.
@@ -1,11 +1,17 @@
 """Module grouping session scoped PyTest fixtures."""
 
+import copy
 import datetime
 import glob
 import os
 import tempfile
+from functools import lru_cache
 
 import owslib
+import owslib.feature.common
+import owslib.feature.schema
+import owslib.feature.wfs110
+import owslib.util
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from owslib.etree import etree
@@ -23,11 +29,60 @@ from pydov.util.dovutil import build_dov_url
 
 def pytest_runtest_setup():
     pydov.hooks = Hooks()
+    owsutil.clear_caches()
 
 
 def pytest_configure(config):
     config.addinivalue_line("markers",
                             "online: mark test that requires internet access")
+    config.addinivalue_line(
+        "markers",
+        "slow: mark test doing a full XML parse and dataframe roundtrip")
+
+
+@lru_cache(maxsize=None)
+def _read_file(file_path):
+    """Read the given file and return its contents as bytes.
+
+    Contents are cached per path, so each fixture file is read from disk
+    only once per session regardless of how many tests (or calls within
+    a test) use it.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file to read.
+
+    Returns
+    -------
+    bytes
+        Contents of the file.
+
+    """
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _parse_file(file_path):
+    """Parse the given XML file and return the parsed tree.
+
+    Trees are cached per path, so each fixture file is parsed only once
+    per session. Callers handing the tree to code under test should pass
+    a ``copy.deepcopy`` of it, so mutations cannot leak between tests.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the XML file to parse.
+
+    Returns
+    -------
+    etree.Element
+        Root element of the parsed XML tree.
+
+    """
+    return etree.fromstring(_read_file(file_path))
 
 
 @pytest.fixture(scope='module')
@@ -48,13 +103,8 @@ def mp_wfs(monkeymodule):
 
     """
     def read(*args, **kwargs):
-        with open('tests/data/util/owsutil/wfscapabilities.xml', 'r',
-                  encoding='utf-8') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-            data = etree.fromstring(data)
-        return data
+        return copy.deepcopy(
+            _parse_file('tests/data/util/owsutil/wfscapabilities.xml'))
 
     monkeymodule.setattr(
         owslib.feature.common.WFSCapabilitiesReader, 'read', read)
@@ -91,12 +141,8 @@ def mp_remote_fc_notfound(monkeypatch):
 
     """
     def __get_remote_fc(*args, **kwargs):
-        with open('tests/data/util/owsutil/fc_featurecatalogue_notfound.xml',
-                  'r') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-        return data
+        return _read_file(
+            'tests/data/util/owsutil/fc_featurecatalogue_notfound.xml')
 
     monkeypatch.setattr(pydov.util.owsutil, '__get_remote_fc', __get_remote_fc)
 
@@ -120,11 +166,7 @@ def mp_remote_md(wfs, monkeymodule, request):
     """
     def __get_remote_md(*args, **kwargs):
         file_path = getattr(request.module, "location_md_metadata")
-        with open(file_path, 'r') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-        return MD_Metadata(etree.fromstring(data).find(
+        return MD_Metadata(copy.deepcopy(_parse_file(file_path)).find(
             './{http://www.isotc211.org/2005/gmd}MD_Metadata'))
 
     monkeymodule.setattr(pydov.util.owsutil, 'get_remote_metadata',
@@ -149,11 +191,7 @@ def mp_remote_fc(monkeymodule, request):
     """
     def __get_remote_fc(*args, **kwargs):
         file_path = getattr(request.module, "location_fc_featurecatalogue")
-        with open(file_path, 'r') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-        return data
+        return _read_file(file_path)
 
     monkeymodule.setattr(pydov.util.owsutil, '__get_remote_fc',
                          __get_remote_fc)
@@ -177,11 +215,7 @@ def mp_remote_describefeaturetype(monkeymodule, request):
     """
     def __get_remote_describefeaturetype(*args, **kwargs):
         file_path = getattr(request.module, "location_wfs_describefeaturetype")
-        with open(file_path, 'r') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-        return data
+        return _read_file(file_path)
 
     monkeymodule.setattr(pydov.util.owsutil,
                          '__get_remote_describefeaturetype',
@@ -192,12 +226,7 @@ def mp_remote_describefeaturetype(monkeymodule, request):
 def mp_get_schema(monkeymodule, request):
     def __get_schema(*args, **kwargs):
         file_path = getattr(request.module, "location_wfs_describefeaturetype")
-        with open(file_path, 'r') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-
-        root = etree.fromstring(data)
+        root = copy.deepcopy(_parse_file(file_path))
 
         typename = root.find(
             './{http://www.w3.org/2001/XMLSchema}element').get('name')
@@ -240,9 +269,7 @@ def wfs_getfeature(request):
 
     """
     file_path = getattr(request.module, "location_wfs_getfeature")
-    with open(file_path, 'r') as f:
-        data = f.read()
-        return data
+    return _read_file(file_path).decode('utf-8')
 
 
 @pytest.fixture(scope='module')
@@ -264,8 +291,7 @@ def wfs_feature(request):
 
     """
     file_path = getattr(request.module, "location_wfs_feature")
-    with open(file_path, 'r') as f:
-        return etree.fromstring(f.read())
+    return copy.deepcopy(_parse_file(file_path))
 
 
 @pytest.fixture(scope='module')
@@ -283,12 +309,9 @@ def mp_remote_wfs_feature(monkeymodule, request):
         PyTest fixture providing request context.
 
     """
+    data = _read_file(getattr(request.module, "location_wfs_getfeature"))
+
     def __get_remote_wfs_feature(*args, **kwargs):
-        file_path = getattr(request.module, "location_wfs_getfeature")
-        with open(file_path, 'r') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
         return data
 
     monkeymodule.setattr(pydov.util.owsutil,
@@ -314,11 +337,7 @@ def mp_dov_xml(monkeymodule, request):
 
     def _get_xml_data(*args, **kwargs):
         file_path = getattr(request.module, "location_dov_xml")
-        with open(file_path, 'r', encoding="utf-8") as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-        return data
+        return _read_file(file_path)
 
     monkeymodule.setattr(pydov.types.abstract.AbstractDovType,
                          '_get_xml_data', _get_xml_data)
@@ -363,11 +382,7 @@ def mp_remote_xsd(monkeymodule, request):
         schemas = []
 
         for xsd_file in glob.glob(xsd_base_path):
-            with open(xsd_file, 'r', encoding="utf-8") as f:
-                data = f.read()
-                if not isinstance(data, bytes):
-                    data = data.encode('utf-8')
-                schemas.append(etree.fromstring(data))
+            schemas.append(copy.deepcopy(_parse_file(xsd_file)))
 
         return schemas
 
@@ -375,7 +390,7 @@ def mp_remote_xsd(monkeymodule, request):
                          '_get_remote_xsd_schemas', _get_remote_xsd)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def md_metadata(wfs, mp_remote_md):
     """PyTest fixture providing a MD_Metadata instance of the
     dov-pub:Boringen layer.
@@ -411,11 +426,7 @@ def mp_remote_xml(monkeypatch):
     """
 
     def _get_remote_data(*args, **kwargs):
-        with open('tests/data/types/boring/boring.xml', 'r') as f:
-            data = f.read()
-            if not isinstance(data, bytes):
-                data = data.encode('utf-8')
-        return data
+        return _read_file('tests/data/types/boring/boring.xml')
 
     monkeypatch.setattr(pydov.util.caching.AbstractFileCache,
                         '_get_remote', _get_remote_data)
@@ -513,7 +524,7 @@ def patch_owslib_openURL(monkeypatch):
         url = args[0]
         return ResponseWrapper(pydov.session.get(url))
 
-    monkeypatch.setattr('owslib.util.openURL', _openURL)
-    monkeypatch.setattr('owslib.feature.common.openURL', _openURL)
-    monkeypatch.setattr('owslib.feature.schema.openURL', _openURL)
-    monkeypatch.setattr('owslib.feature.wfs110.openURL', _openURL)
+    monkeypatch.setattr(owslib.util, 'openURL', _openURL)
+    monkeypatch.setattr(owslib.feature.common, 'openURL', _openURL)
+    monkeypatch.setattr(owslib.feature.schema, 'openURL', _openURL)
+    monkeypatch.setattr(owslib.feature.wfs110, 'openURL', _openURL)
@@ -148,9 +148,9 @@ class TestNoXDOV(object):
         )
         os.makedirs(os.path.dirname(cache_path))
 
-        with open(testdata_path, 'r') as testdata:
+        with open(testdata_path, 'rb') as testdata:
             with gzip.open(cache_path, 'wb') as cached_data:
-                cached_data.write(testdata.read().encode('utf8'))
+                cached_data.write(testdata.read())
         time.sleep(0.5)
 
         bs.search(query=PropertyIsEqualTo(
@@ -175,9 +175,9 @@ class TestNoXDOV(object):
         )
         os.makedirs(os.path.dirname(cache_path))
 
-        with open(testdata_path, 'r') as testdata:
+        with open(testdata_path, 'rb') as testdata:
             with gzip.open(cache_path, 'wb') as cached_data:
-                cached_data.write(testdata.read().encode('utf8'))
+                cached_data.write(testdata.read())
         time.sleep(0.5)
 
         with pytest.warns(XmlStaleWarning):
@@ -205,9 +205,9 @@ class TestNoXDOV(object):
         )
         os.makedirs(os.path.dirname(cache_path))
 
-        with open(testdata_path, 'r') as testdata:
+        with open(testdata_path, 'rb') as testdata:
             with gzip.open(cache_path, 'wb') as cached_data:
-                cached_data.write(testdata.read().encode('utf8'))
+                cached_data.write(testdata.read())
         time.sleep(0.5)
 
         with pytest.warns(XmlFetchWarning):
@@ -323,9 +323,9 @@ class TestNoXDOV(object):
         )
         os.makedirs(os.path.dirname(cache_path))
 
-        with open(testdata_path, 'r') as testdata:
+        with open(testdata_path, 'rb') as testdata:
             with gzip.open(cache_path, 'wb') as cached_data:
-                cached_data.write(testdata.read().encode('utf8'))
+                cached_data.write(testdata.read())
         time.sleep(0.5)
 
         bs.search(query=PropertyIsEqualTo(
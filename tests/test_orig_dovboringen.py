@@ -0,0 +1,31 @@
+"""Module grouping tests for the orig.dovboringen module."""
+from owslib import fes
+
+from orig.dovboringen import DovBoringen
+from tests.abstract import clean_xml
+
+wfs_filters = {'=': fes.PropertyIsEqualTo,
+               '<<': fes.PropertyIsBetween}
+
+
+class TestDovBoringen(object):
+    """Class grouping tests for the orig.dovboringen.DovBoringen class."""
+
+    def test_compose_query_between(self):
+        """Test the compose_query method with the between operator.
+
+        Test whether the XML of the WFS constraint is generated correctly.
+
+        """
+        filterxml = DovBoringen.compose_query(
+            'diepte_tot_m << (20,100)', (), wfs_filters)
+
+        assert clean_xml(filterxml.decode('utf8')) == clean_xml(
+            '<ogc:Filter xmlns:ogc="http://www.opengis.net/ogc">'
+            '<ogc:PropertyIsBetween>'
+            '<ogc:PropertyName>diepte_tot_m</ogc:PropertyName>'
+            '<ogc:LowerBoundary><ogc:Literal>20</ogc:Literal>'
+            '</ogc:LowerBoundary>'
+            '<ogc:UpperBoundary><ogc:Literal>100</ogc:Literal>'
+            '</ogc:UpperBoundary>'
+            '</ogc:PropertyIsBetween></ogc:Filter>')
@@ -37,11 +37,11 @@ class TestBodemlocatieSearch(AbstractTestSearch):
         'educatieve_waarde')
     valid_returnfields_extra = ('pkey_bodemlocatie', 'naam', 'erfgoed')
 
-    df_default_columns = ['pkey_bodemlocatie', 'pkey_bodemsite',
+    df_default_columns = ('pkey_bodemlocatie', 'pkey_bodemsite',
                           'naam', 'type', 'waarnemingsdatum', 'doel', 'x', 'y',
                           'mv_mtaw', 'erfgoed', 'bodemstreek',
                           'invoerdatum',
-                          'educatieve_waarde']
+                          'educatieve_waarde')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -72,4 +72,4 @@ class TestBodemlocatieSearch(AbstractTestSearch):
             query=self.valid_query_single)
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.waarnemingsdatum.unique()[0] == datetime.date(2011, 9, 16)
+        assert df.waarnemingsdatum.iat[0] == datetime.date(2011, 9, 16)
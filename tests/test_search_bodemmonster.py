@@ -41,13 +41,13 @@ class TestBodemmonsterSearch(AbstractTestSearch):
         'identificatie',
         'Opdrachten')
 
-    df_default_columns = ['pkey_bodemmonster', 'pkey_bodemlocatie',
+    df_default_columns = ('pkey_bodemmonster', 'pkey_bodemlocatie',
                           'pkey_parent',
                           'x', 'y', 'mv_mtaw', 'identificatie',
                           'datum_monstername', 'tijdstip_monstername',
                           'type', 'monstername_door', 'techniek',
                           'condities', 'diepte_van_cm', 'diepte_tot_cm',
-                          'labo']
+                          'labo')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -78,4 +78,4 @@ class TestBodemmonsterSearch(AbstractTestSearch):
             query=self.valid_query_single)
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.datum_monstername.unique()[0] == datetime.date(2015, 6, 30)
+        assert df.datum_monstername.iat[0] == datetime.date(2015, 6, 30)
@@ -43,11 +43,11 @@ class TestBodemobservatieSearch(AbstractTestSearch):
         'parameter',
         'Opmerkingen')
 
-    df_default_columns = ['pkey_bodemobservatie', 'pkey_bodemlocatie',
+    df_default_columns = ('pkey_bodemobservatie', 'pkey_bodemlocatie',
                           'pkey_parent', 'x', 'y', 'mv_mtaw', 'diepte_van_cm',
                           'diepte_tot_cm', 'observatiedatum', 'invoerdatum',
                           'parametergroep', 'parameter', 'detectie', 'waarde',
-                          'eenheid', 'veld_labo', 'methode', 'betrouwbaarheid']
+                          'eenheid', 'veld_labo', 'methode', 'betrouwbaarheid')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -78,4 +78,4 @@ class TestBodemobservatieSearch(AbstractTestSearch):
             query=self.valid_query_single)
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.observatiedatum.unique()[0] == datetime.date(1965, 7, 30)
+        assert df.observatiedatum.iat[0] == datetime.date(1965, 7, 30)
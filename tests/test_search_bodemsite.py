@@ -37,8 +37,8 @@ class TestBodemsiteSearch(AbstractTestSearch):
         'naam',
         'Aantal_bodemlocaties')
 
-    df_default_columns = ['pkey_bodemsite', 'naam', 'waarnemingsdatum',
-                          'beschrijving', 'invoerdatum']
+    df_default_columns = ('pkey_bodemsite', 'naam', 'waarnemingsdatum',
+                          'beschrijving', 'invoerdatum')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -69,4 +69,4 @@ class TestBodemsiteSearch(AbstractTestSearch):
             query=self.valid_query_single)
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.waarnemingsdatum.unique()[0] == datetime.date(2013, 9, 16)
+        assert df.waarnemingsdatum.iat[0] == datetime.date(2013, 9, 16)
@@ -36,12 +36,12 @@ class TestBoringSearch(AbstractTestSearch):
                                   'diepte_methode_van', 'diepte_methode_tot')
     valid_returnfields_extra = ('pkey_boring', 'doel')
 
-    df_default_columns = ['pkey_boring', 'boornummer', 'x', 'y', 'mv_mtaw',
+    df_default_columns = ('pkey_boring', 'boornummer', 'x', 'y', 'mv_mtaw',
                           'start_boring_mtaw', 'gemeente',
                           'diepte_boring_van', 'diepte_boring_tot',
                           'datum_aanvang', 'uitvoerder', 'boorgatmeting',
                           'diepte_methode_van', 'diepte_methode_tot',
-                          'boormethode']
+                          'boormethode')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -72,7 +72,7 @@ class TestBoringSearch(AbstractTestSearch):
             query=self.valid_query_single)
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.datum_aanvang.unique()[0] == datetime.date(2004, 12, 20)
+        assert df.datum_aanvang.iat[0] == datetime.date(2004, 12, 20)
 
     def test_search_nan(self, mp_wfs, mp_get_schema,
                         mp_remote_describefeaturetype, mp_remote_md,
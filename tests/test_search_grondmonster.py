@@ -34,14 +34,14 @@ class TestGrondmonsterSearch(AbstractTestSearch):
         'pkey_grondmonster', 'boornummer', 'diameter')
     valid_returnfields_extra = ('pkey_grondmonster', 'korrelverdeling')
 
-    df_default_columns = [
+    df_default_columns = (
         'pkey_grondmonster', 'naam', 'pkey_boring', 'boornummer',
         'datum', 'x', 'y', 'gemeente', 'diepte_van_m', 'diepte_tot_m',
         'peil_van_mtaw', 'peil_tot_mtaw', 'monstertype', 'astm_naam',
         'grondsoort_bggg', 'humusgehalte', 'kalkgehalte',
         'uitrolgrens', 'vloeigrens', 'glauconiet',
         'korrelvolumemassa', 'volumemassa', 'watergehalte',
-        'diameter', 'fractie', 'methode']
+        'diameter', 'fractie', 'methode')
 
     def test_search_xmlresolving(self, mp_get_schema,
                                  mp_remote_describefeaturetype,
@@ -36,7 +36,7 @@ class TestGrondwaterfilterSearch(AbstractTestSearch):
     valid_returnfields_subtype = ('pkey_filter', 'filternummer', 'peil_mtaw')
     valid_returnfields_extra = ('pkey_filter', 'beheerder')
 
-    df_default_columns = ['pkey_filter', 'pkey_grondwaterlocatie', 'gw_id',
+    df_default_columns = ('pkey_filter', 'pkey_grondwaterlocatie', 'gw_id',
                           'filternummer', 'filtertype', 'x', 'y',
                           'start_grondwaterlocatie_mtaw', 'mv_mtaw',
                           'gemeente', 'meetnet_code', 'aquifer_code',
@@ -44,7 +44,7 @@ class TestGrondwaterfilterSearch(AbstractTestSearch):
                           'diepte_onderkant_filter', 'lengte_filter',
                           'datum', 'tijdstip', 'peil_mtaw',
                           'betrouwbaarheid', 'methode', 'filterstatus',
-                          'filtertoestand']
+                          'filtertoestand')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -38,12 +38,12 @@ class TestGrondwaterMonsterSearch(AbstractTestSearch):
         'pkey_grondwatermonster', 'datum_monstername', 'eenheid')
     valid_returnfields_extra = ('pkey_grondwatermonster', 'kationen')
 
-    df_default_columns = [
+    df_default_columns = (
         'pkey_grondwatermonster', 'grondwatermonsternummer',
         'pkey_grondwaterlocatie', 'gw_id', 'pkey_filter',
         'filternummer', 'x', 'y', 'start_grondwaterlocatie_mtaw',
         'gemeente', 'datum_monstername', 'parametergroep',
-        'parameter', 'detectie', 'waarde', 'eenheid', 'veld_labo']
+        'parameter', 'detectie', 'waarde', 'eenheid', 'veld_labo')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -37,13 +37,13 @@ class TestGrondwaterVergunningSearch(AbstractTestSearch):
     valid_returnfields_subtype = None
     valid_returnfields_extra = ('inrichtingsnummer', 'vergund_aantal_putten')
 
-    df_default_columns = [
+    df_default_columns = (
         'id_vergunning', 'pkey_installatie', 'x', 'y',
         'diepte', 'exploitant_naam', 'watnr', 'vlaremrubriek',
         'vergund_jaardebiet', 'vergund_dagdebiet',
         'van_datum_termijn', 'tot_datum_termijn',
         'aquifer_vergunning', 'inrichtingsklasse', 'nacebelcode',
-        'actie_waakgebied', 'cbbnr', 'kbonr']
+        'actie_waakgebied', 'cbbnr', 'kbonr')
 
     def test_search_customreturnfields(self, mp_get_schema,
                                        mp_remote_describefeaturetype,
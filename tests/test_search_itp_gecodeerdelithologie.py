@@ -46,7 +46,7 @@ class TestGecodeerdeLithologieSearch(AbstractTestSearch):
         'pkey_interpretatie', 'diepte_laag_van', 'diepte_laag_tot')
     valid_returnfields_extra = ('pkey_interpretatie', 'gemeente')
 
-    df_default_columns = ['pkey_interpretatie', 'pkey_boring',
+    df_default_columns = ('pkey_interpretatie', 'pkey_boring',
                           'betrouwbaarheid_interpretatie', 'x', 'y',
                           'start_interpretatie_mtaw',
                           'diepte_laag_van', 'diepte_laag_tot',
@@ -55,7 +55,7 @@ class TestGecodeerdeLithologieSearch(AbstractTestSearch):
                           'bijmenging1_grondsoort', 'bijmenging2_plaatselijk',
                           'bijmenging2_hoeveelheid', 'bijmenging2_grondsoort',
                           'bijmenging3_plaatselijk', 'bijmenging3_hoeveelheid',
-                          'bijmenging3_grondsoort']
+                          'bijmenging3_grondsoort')
 
     def test_search_nan(self, mp_wfs, mp_get_schema,
                         mp_remote_describefeaturetype, mp_remote_md,
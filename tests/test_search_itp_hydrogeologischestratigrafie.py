@@ -47,11 +47,11 @@ class TestHydrogeologischeStratigrafieSearch(AbstractTestSearch):
         'pkey_interpretatie', 'diepte_laag_van', 'diepte_laag_tot')
     valid_returnfields_extra = ('pkey_interpretatie', 'gemeente')
 
-    df_default_columns = ['pkey_interpretatie', 'pkey_boring',
+    df_default_columns = ('pkey_interpretatie', 'pkey_boring',
                           'betrouwbaarheid_interpretatie', 'x', 'y',
                           'start_interpretatie_mtaw',
                           'diepte_laag_van', 'diepte_laag_tot',
-                          'aquifer']
+                          'aquifer')
 
     def test_search_nan(self, mp_wfs, mp_get_schema,
                         mp_remote_describefeaturetype, mp_remote_md,
@@ -46,11 +46,11 @@ class TestLithologischeBeschrijvingenSearch(AbstractTestSearch):
         'pkey_interpretatie', 'diepte_laag_van', 'diepte_laag_tot')
     valid_returnfields_extra = ('pkey_interpretatie', 'gemeente')
 
-    df_default_columns = [
+    df_default_columns = (
         'pkey_interpretatie', 'pkey_boring',
         'betrouwbaarheid_interpretatie', 'x', 'y',
         'start_interpretatie_mtaw',
-        'diepte_laag_van', 'diepte_laag_tot', 'beschrijving']
+        'diepte_laag_van', 'diepte_laag_tot', 'beschrijving')
 
     def test_search_customreturnfields(self, mp_get_schema,
                                        mp_remote_describefeaturetype,
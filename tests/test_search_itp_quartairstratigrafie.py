@@ -43,11 +43,11 @@ class TestQuartairStratigrafieSearch(AbstractTestSearch):
         'pkey_interpretatie', 'diepte_laag_van', 'diepte_laag_tot')
     valid_returnfields_extra = ('pkey_interpretatie', 'gemeente')
 
-    df_default_columns = ['pkey_interpretatie', 'pkey_boring',
+    df_default_columns = ('pkey_interpretatie', 'pkey_boring',
                           'betrouwbaarheid_interpretatie', 'x', 'y',
                           'start_interpretatie_mtaw',
                           'diepte_laag_van', 'diepte_laag_tot',
-                          'lid1', 'relatie_lid1_lid2', 'lid2']
+                          'lid1', 'relatie_lid1_lid2', 'lid2')
 
     def test_search_customreturnfields(self, mp_get_schema,
                                        mp_remote_describefeaturetype,
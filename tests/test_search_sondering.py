@@ -38,12 +38,12 @@ class TestSonderingSearch(AbstractTestSearch):
         'pkey_sondering', 'sondeernummer', 'lengte', 'qc', 'Qt')
     valid_returnfields_extra = ('pkey_sondering', 'conus')
 
-    df_default_columns = [
+    df_default_columns = (
         'pkey_sondering', 'sondeernummer', 'x', 'y', 'mv_mtaw',
         'start_sondering_mtaw', 'diepte_sondering_van',
         'diepte_sondering_tot', 'datum_aanvang', 'uitvoerder',
         'sondeermethode', 'apparaat', 'datum_gw_meting',
-        'diepte_gw_m', 'lengte', 'diepte', 'qc', 'Qt', 'fs', 'u', 'i']
+        'diepte_gw_m', 'lengte', 'diepte', 'qc', 'Qt', 'fs', 'u', 'i')
 
     def test_search_date(self, mp_wfs, mp_get_schema,
                          mp_remote_describefeaturetype, mp_remote_md,
@@ -74,10 +74,10 @@ class TestSonderingSearch(AbstractTestSearch):
             query=self.valid_query_single)
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.datum_aanvang.unique()[0] == datetime.date(2002, 12, 17)
+        assert df.datum_aanvang.iat[0] == datetime.date(2002, 12, 17)
 
         assert pd.Timestamp(
-            df.datum_gw_meting.unique()[0]).to_pydatetime() == \
+            df.datum_gw_meting.iat[0]).to_pydatetime() == \
             datetime.datetime(2002, 12, 17, 14, 30, 0, 0)
 
     def test_search_nan(self, mp_wfs, mp_get_schema,
@@ -247,8 +247,8 @@ class TestPlainTextFileCacheCache(object):
             build_dov_url('data/boring/2004-103984.xml'))
         assert os.path.exists(cached_file)
 
-        with open('tests/data/types/boring/boring.xml', 'r') as ref:
-            ref_data = ref.read().encode('utf-8')
+        with open('tests/data/types/boring/boring.xml', 'rb') as ref:
+            ref_data = ref.read()
 
         cached_data = plaintext_cache.get(
             build_dov_url('data/boring/2004-103984.xml'))
@@ -529,8 +529,8 @@ class TestGzipTextFileCacheCache(object):
             build_dov_url('data/boring/2004-103984.xml'))
         assert os.path.exists(cached_file)
 
-        with open('tests/data/types/boring/boring.xml', 'r') as ref:
-            ref_data = ref.read().encode('utf-8')
+        with open('tests/data/types/boring/boring.xml', 'rb') as ref:
+            ref_data = ref.read()
 
         cached_data = gziptext_cache.get(
             build_dov_url('data/boring/2004-103984.xml'))
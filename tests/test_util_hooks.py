@@ -11,6 +11,9 @@ from pydov.util.hooks import (AbstractInjectHook, AbstractReadHook, Hooks,
                               SimpleStatusHook)
 from tests.abstract import ServiceCheck
 
+valid_query_single = PropertyIsEqualTo(propertyname='boornummer',
+                                       literal='GEO-04/169-BNo-B1')
+
 
 @pytest.fixture
 def test_hook_count():
@@ -220,8 +223,7 @@ class TestHookCount(object):
             Fixture removing default hooks and installing HookCounter.
 
         """
-        query = PropertyIsEqualTo(propertyname='boornummer',
-                                  literal='GEO-04/169-BNo-B1')
+        query = valid_query_single
 
         boringsearch = BoringSearch()
         boringsearch.search(
@@ -258,8 +260,7 @@ class TestHookCount(object):
             Fixture temporarily disabling caching.
 
         """
-        query = PropertyIsEqualTo(propertyname='boornummer',
-                                  literal='GEO-04/169-BNo-B1')
+        query = valid_query_single
 
         boringsearch = BoringSearch()
         boringsearch.search(
@@ -318,8 +319,7 @@ class TestHookCount(object):
             second.
 
         """
-        query = PropertyIsEqualTo(propertyname='boornummer',
-                                  literal='GEO-04/169-BNo-B1')
+        query = valid_query_single
 
         boringsearch = BoringSearch()
         boringsearch.search(
@@ -378,8 +378,7 @@ class TestHookTypes(object):
             (SimpleStatusHook(),)
         )
 
-        query = PropertyIsEqualTo(propertyname='boornummer',
-                                  literal='GEO-04/169-BNo-B1')
+        query = valid_query_single
 
         boringsearch = BoringSearch()
         boringsearch.search(query=query)
@@ -396,8 +395,7 @@ class TestHookTypes(object):
             Fixture removing default hooks and installing HookTester.
 
         """
-        query = PropertyIsEqualTo(propertyname='boornummer',
-                                  literal='GEO-04/169-BNo-B1')
+        query = valid_query_single
 
         boringsearch = BoringSearch()
         boringsearch.search(query=query)
@@ -418,8 +416,7 @@ class TestHookInject(object):
             Fixture removing default hooks and installing HookTester.
 
         """
-        query = PropertyIsEqualTo(propertyname='boornummer',
-                                  literal='GEO-04/169-BNo-B1')
+        query = valid_query_single
 
         boringsearch = BoringSearch()
 
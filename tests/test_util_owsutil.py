@@ -20,6 +20,163 @@ location_fc_featurecatalogue = \
 location_wfs_describefeaturetype = \
     'tests/data/types/boring/wfsdescribefeaturetype.xml'
 
+contentinfo_tag = '{http://www.isotc211.org/2005/gmd}contentInfo'
+fc_citation_path = nspath_eval(
+    'gmd:contentInfo/'
+    'gmd:MD_FeatureCatalogueDescription/'
+    'gmd:featureCatalogueCitation',
+    {'gmd': 'http://www.isotc211.org/2005/gmd'})
+
+herstappe_filter = etree.tostring(
+    FilterRequest().setConstraint(
+        PropertyIsEqualTo(propertyname='gemeente', literal='Herstappe')),
+    encoding='unicode')
+
+sort_by_single = etree.tostring(
+    SortBy([SortProperty('diepte_tot_m', 'DESC')]).toXML(),
+    encoding='unicode')
+
+sort_by_multi = etree.tostring(
+    SortBy([SortProperty('diepte_tot_m', 'DESC'),
+            SortProperty('datum_aanvang', 'ASC')]).toXML(),
+    encoding='unicode')
+
+getfeature_cases = [
+    pytest.param(
+        {},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
+        'typeName="dov-pub:Boringen"><ogc:Filter '
+        'xmlns:ogc="http://www.opengis.net/ogc"/></wfs:Query></wfs'
+        ':GetFeature>',
+        id='onlytypename'),
+    pytest.param(
+        {'location': Within(Box(151650, 214675, 151750, 214775)),
+         'geometry_column': 'geom'},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
+        'typeName="dov-pub:Boringen"><ogc:Filter '
+        'xmlns:ogc="http://www.opengis.net/ogc"><ogc:Within> '
+        '<ogc:PropertyName>geom</ogc:PropertyName><gml:Envelope '
+        'xmlns:gml="http://www.opengis.net/gml" srsDimension="2" '
+        'srsName="http://www.opengis.net/gml/srs/epsg.xml#31370"><gml'
+        ':lowerCorner>151650.000000 '
+        '214675.000000</gml:lowerCorner><gml:upperCorner>151750.000000 '
+        '214775.000000</gml:upperCorner></gml:Envelope></ogc:Within></ogc'
+        ':Filter></wfs:Query></wfs:GetFeature>',
+        id='bbox'),
+    pytest.param(
+        {'propertyname': ['fiche', 'diepte_tot_m']},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
+        'typeName="dov-pub:Boringen"> '
+        '<wfs:PropertyName>diepte_tot_m</wfs:PropertyName> '
+        '<wfs:PropertyName>fiche</wfs:PropertyName> <ogc:Filter/> '
+        '</wfs:Query> </wfs:GetFeature>',
+        id='propertyname'),
+    pytest.param(
+        {'filter': herstappe_filter},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
+        'typeName="dov-pub:Boringen"> <ogc:Filter> '
+        '<ogc:PropertyIsEqualTo> '
+        '<ogc:PropertyName>gemeente</ogc:PropertyName> '
+        '<ogc:Literal>Herstappe</ogc:Literal> </ogc:PropertyIsEqualTo> '
+        '</ogc:Filter> </wfs:Query> </wfs:GetFeature>',
+        id='filter'),
+    pytest.param(
+        {'filter': herstappe_filter,
+         'location': Within(Box(151650, 214675, 151750, 214775)),
+         'geometry_column': 'geom'},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
+        'typeName="dov-pub:Boringen"> <ogc:Filter> <ogc:And> '
+        '<ogc:PropertyIsEqualTo> '
+        '<ogc:PropertyName>gemeente</ogc:PropertyName> '
+        '<ogc:Literal>Herstappe</ogc:Literal> </ogc:PropertyIsEqualTo> '
+        '<ogc:Within> <ogc:PropertyName>geom</ogc:PropertyName> '
+        '<gml:Envelope xmlns:gml="http://www.opengis.net/gml" '
+        'srsDimension="2" '
+        'srsName="http://www.opengis.net/gml/srs/epsg.xml#31370"> '
+        '<gml:lowerCorner>151650.000000 214675.000000</gml:lowerCorner> '
+        '<gml:upperCorner>151750.000000 214775.000000</gml:upperCorner> '
+        '</gml:Envelope> </ogc:Within> </ogc:And> </ogc:Filter> '
+        '</wfs:Query> </wfs:GetFeature>',
+        id='bbox_filter'),
+    pytest.param(
+        {'filter': herstappe_filter,
+         'location': Within(Box(151650, 214675, 151750, 214775)),
+         'geometry_column': 'geom',
+         'propertyname': ['fiche', 'diepte_tot_m']},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
+        'typeName="dov-pub:Boringen"> '
+        '<wfs:PropertyName>diepte_tot_m</wfs:PropertyName> '
+        '<wfs:PropertyName>fiche</wfs:PropertyName> <ogc:Filter> '
+        '<ogc:And> <ogc:PropertyIsEqualTo> '
+        '<ogc:PropertyName>gemeente</ogc:PropertyName> '
+        '<ogc:Literal>Herstappe</ogc:Literal> </ogc:PropertyIsEqualTo> '
+        '<ogc:Within> <ogc:PropertyName>geom</ogc:PropertyName> '
+        '<gml:Envelope xmlns:gml="http://www.opengis.net/gml" '
+        'srsDimension="2" '
+        'srsName="http://www.opengis.net/gml/srs/epsg.xml#31370"> '
+        '<gml:lowerCorner>151650.000000 214675.000000</gml:lowerCorner> '
+        '<gml:upperCorner>151750.000000 214775.000000</gml:upperCorner> '
+        '</gml:Envelope> </ogc:Within> </ogc:And> </ogc:Filter> '
+        '</wfs:Query> </wfs:GetFeature>',
+        id='bbox_filter_propertyname'),
+    pytest.param(
+        {'propertyname': ['fiche', 'diepte_tot_m'],
+         'sort_by': sort_by_single},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
+        'typeName="dov-pub:Boringen"><wfs:PropertyName>diepte_tot_m</wfs'
+        ':PropertyName><wfs:PropertyName>fiche</wfs:PropertyName'
+        '><ogc:Filter/><ogc:SortBy><ogc:SortProperty><ogc:PropertyName'
+        '>diepte_tot_m</ogc:PropertyName><ogc:SortOrder>DESC</ogc'
+        ':SortOrder></ogc:SortProperty></ogc:SortBy></wfs:Query></wfs'
+        ':GetFeature>',
+        id='sortby'),
+    pytest.param(
+        {'propertyname': ['fiche', 'diepte_tot_m'],
+         'sort_by': sort_by_multi},
+        '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'service="WFS" version="1.1.0" '
+        'xsi:schemaLocation="http://www.opengis.net/wfs '
+        'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
+        'typeName="dov-pub:Boringen"><wfs:PropertyName>diepte_tot_m</wfs'
+        ':PropertyName><wfs:PropertyName>fiche</wfs:PropertyName'
+        '><ogc:Filter/><ogc:SortBy><ogc:SortProperty><ogc:PropertyName'
+        '>diepte_tot_m</ogc:PropertyName><ogc:SortOrder>DESC</ogc'
+        ':SortOrder></ogc:SortProperty><ogc:SortProperty><ogc'
+        ':PropertyName>datum_aanvang</ogc:PropertyName><ogc:SortOrder>ASC'
+        '</ogc:SortOrder></ogc:SortProperty></ogc:SortBy></wfs:Query>'
+        '</wfs:GetFeature>',
+        id='sortby_multi'),
+]
+
 
 class TestOwsutil(object):
     """Class grouping tests for the pydov.util.owsutil module."""
@@ -87,8 +244,7 @@ class TestOwsutil(object):
 
         """
         tree = etree.fromstring(md_metadata.xml)
-        for ci in tree.findall(
-                './/{http://www.isotc211.org/2005/gmd}contentInfo'):
+        for ci in list(tree.iter(contentinfo_tag)):
             tree.remove(ci)
         md_metadata = MD_Metadata(tree)
 
@@ -109,11 +265,7 @@ class TestOwsutil(object):
 
         """
         tree = etree.fromstring(md_metadata.xml)
-        for ci in tree.findall(nspath_eval(
-            'gmd:contentInfo/'
-            'gmd:MD_FeatureCatalogueDescription/'
-            'gmd:featureCatalogueCitation',
-                {'gmd': 'http://www.isotc211.org/2005/gmd'})):
+        for ci in tree.findall(fc_citation_path):
             ci.attrib.pop('uuidref')
         md_metadata = MD_Metadata(tree)
 
@@ -175,12 +327,11 @@ class TestOwsutil(object):
                 if attr['values'] is not None:
                     assert isinstance(attr['values'], dict)
 
-                    for v in attr['values'].keys():
-                        assert isinstance(v, str)
-                        assert isinstance(attr['values'][v], str) or \
-                            attr['values'][v] is None
-                    assert len(attr['values'].keys()) == len(
-                        set(attr['values'].keys()))
+                    values = attr['values']
+                    assert all(isinstance(v, str) for v in values)
+                    assert all(v is None or isinstance(v, str)
+                               for v in values.values())
+                    assert len(set(values)) == len(values)
 
                 assert 'multiplicity' in attr
                 mp = attr['multiplicity']
@@ -220,23 +371,26 @@ class TestOwsutil(object):
         """
         assert isinstance(md_metadata, MD_Metadata)
 
-    def test_wfs_build_getfeature_request_onlytypename(self):
-        """Test the owsutil.wfs_build_getfeature_request method with only a
-        typename specified.
+    @pytest.mark.parametrize('kwargs,expected', getfeature_cases)
+    def test_wfs_build_getfeature_request(self, kwargs, expected):
+        """Test the owsutil.wfs_build_getfeature_request method.
 
-        Test whether the XML of the WFS GetFeature call is generated correctly.
+        Test whether the XML of the WFS GetFeature call is generated
+        correctly for the given combination of arguments.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword arguments for the wfs_build_getfeature_request call,
+            next to the typename.
+        expected : str
+            Expected XML of the GetFeature request.
 
         """
-        xml = owsutil.wfs_build_getfeature_request('dov-pub:Boringen')
+        xml = owsutil.wfs_build_getfeature_request('dov-pub:Boringen',
+                                                   **kwargs)
         assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
-            'typeName="dov-pub:Boringen"><ogc:Filter '
-            'xmlns:ogc="http://www.opengis.net/ogc"/></wfs:Query></wfs'
-            ':GetFeature>')
+            expected)
 
     def test_wfs_build_getfeature_maxfeatures(self):
         """Test the owsutil.wfs_build_getfeature_request method with a
@@ -307,53 +461,6 @@ class TestOwsutil(object):
                 'dov-pub:Boringen',
                 location=Within(Box(151650, 214675, 151750, 214775)))
 
-    def test_wfs_build_getfeature_request_bbox(self):
-        """Test the owsutil.wfs_build_getfeature_request method with a
-        typename, box and geometry_column.
-
-        Test whether the XML of the WFS GetFeature call is generated correctly.
-
-        """
-        xml = owsutil.wfs_build_getfeature_request(
-            'dov-pub:Boringen',
-            location=Within(Box(151650, 214675, 151750, 214775)),
-            geometry_column='geom')
-        assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
-            'typeName="dov-pub:Boringen"><ogc:Filter '
-            'xmlns:ogc="http://www.opengis.net/ogc"><ogc:Within> '
-            '<ogc:PropertyName>geom</ogc:PropertyName><gml:Envelope '
-            'xmlns:gml="http://www.opengis.net/gml" srsDimension="2" '
-            'srsName="http://www.opengis.net/gml/srs/epsg.xml#31370"><gml'
-            ':lowerCorner>151650.000000 '
-            '214675.000000</gml:lowerCorner><gml:upperCorner>151750.000000 '
-            '214775.000000</gml:upperCorner></gml:Envelope></ogc:Within></ogc'
-            ':Filter></wfs:Query></wfs:GetFeature>')
-
-    def test_wfs_build_getfeature_request_propertyname(self):
-        """Test the owsutil.wfs_build_getfeature_request method with a list
-        of propertynames.
-
-        Test whether the XML of the WFS GetFeature call is generated correctly.
-
-        """
-        xml = owsutil.wfs_build_getfeature_request(
-            'dov-pub:Boringen', propertyname=['fiche', 'diepte_tot_m'])
-        assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
-            'typeName="dov-pub:Boringen"> '
-            '<wfs:PropertyName>diepte_tot_m</wfs:PropertyName> '
-            '<wfs:PropertyName>fiche</wfs:PropertyName> <ogc:Filter/> '
-            '</wfs:Query> </wfs:GetFeature>')
-
     def test_wfs_build_getfeature_request_propertyname_stable(self):
         """Test the owsutil.wfs_build_getfeature_request method with a list
         of propertynames.
@@ -370,162 +477,3 @@ class TestOwsutil(object):
 
         assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
             etree.tostring(xml2).decode('utf8'))
-
-    def test_wfs_build_getfeature_request_filter(self):
-        """Test the owsutil.wfs_build_getfeature_request method with an
-        attribute filter.
-
-        Test whether the XML of the WFS GetFeature call is generated correctly.
-
-        """
-        query = PropertyIsEqualTo(propertyname='gemeente',
-                                  literal='Herstappe')
-        filter_request = FilterRequest()
-        filter_request = filter_request.setConstraint(query)
-        filter_request = etree.tostring(filter_request, encoding='unicode')
-
-        xml = owsutil.wfs_build_getfeature_request(
-            'dov-pub:Boringen', filter=filter_request)
-        assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
-            'typeName="dov-pub:Boringen"> <ogc:Filter> '
-            '<ogc:PropertyIsEqualTo> '
-            '<ogc:PropertyName>gemeente</ogc:PropertyName> '
-            '<ogc:Literal>Herstappe</ogc:Literal> </ogc:PropertyIsEqualTo> '
-            '</ogc:Filter> </wfs:Query> </wfs:GetFeature>')
-
-    def test_wfs_build_getfeature_request_bbox_filter(self):
-        """Test the owsutil.wfs_build_getfeature_request method with an
-        attribute filter, a box and a geometry_column.
-
-        Test whether the XML of the WFS GetFeature call is generated correctly.
-
-        """
-        query = PropertyIsEqualTo(propertyname='gemeente',
-                                  literal='Herstappe')
-        filter_request = FilterRequest()
-        filter_request = filter_request.setConstraint(query)
-        filter_request = etree.tostring(filter_request, encoding='unicode')
-
-        xml = owsutil.wfs_build_getfeature_request(
-            'dov-pub:Boringen', filter=filter_request,
-            location=Within(Box(151650, 214675, 151750, 214775)),
-            geometry_column='geom')
-        assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
-            'typeName="dov-pub:Boringen"> <ogc:Filter> <ogc:And> '
-            '<ogc:PropertyIsEqualTo> '
-            '<ogc:PropertyName>gemeente</ogc:PropertyName> '
-            '<ogc:Literal>Herstappe</ogc:Literal> </ogc:PropertyIsEqualTo> '
-            '<ogc:Within> <ogc:PropertyName>geom</ogc:PropertyName> '
-            '<gml:Envelope xmlns:gml="http://www.opengis.net/gml" '
-            'srsDimension="2" '
-            'srsName="http://www.opengis.net/gml/srs/epsg.xml#31370"> '
-            '<gml:lowerCorner>151650.000000 214675.000000</gml:lowerCorner> '
-            '<gml:upperCorner>151750.000000 214775.000000</gml:upperCorner> '
-            '</gml:Envelope> </ogc:Within> </ogc:And> </ogc:Filter> '
-            '</wfs:Query> </wfs:GetFeature>')
-
-    def test_wfs_build_getfeature_request_bbox_filter_propertyname(self):
-        """Test the owsutil.wfs_build_getfeature_request method with an
-        attribute filter, a box, a geometry_column and a list of
-        propertynames.
-
-        Test whether the XML of the WFS GetFeature call is generated correctly.
-
-        """
-        query = PropertyIsEqualTo(propertyname='gemeente',
-                                  literal='Herstappe')
-        filter_request = FilterRequest()
-        filter_request = filter_request.setConstraint(query)
-        filter_request = etree.tostring(filter_request, encoding='unicode')
-
-        xml = owsutil.wfs_build_getfeature_request(
-            'dov-pub:Boringen', filter=filter_request,
-            location=Within(Box(151650, 214675, 151750, 214775)),
-            geometry_column='geom', propertyname=['fiche', 'diepte_tot_m'])
-        assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"> <wfs:Query '
-            'typeName="dov-pub:Boringen"> '
-            '<wfs:PropertyName>diepte_tot_m</wfs:PropertyName> '
-            '<wfs:PropertyName>fiche</wfs:PropertyName> <ogc:Filter> '
-            '<ogc:And> <ogc:PropertyIsEqualTo> '
-            '<ogc:PropertyName>gemeente</ogc:PropertyName> '
-            '<ogc:Literal>Herstappe</ogc:Literal> </ogc:PropertyIsEqualTo> '
-            '<ogc:Within> <ogc:PropertyName>geom</ogc:PropertyName> '
-            '<gml:Envelope xmlns:gml="http://www.opengis.net/gml" '
-            'srsDimension="2" '
-            'srsName="http://www.opengis.net/gml/srs/epsg.xml#31370"> '
-            '<gml:lowerCorner>151650.000000 214675.000000</gml:lowerCorner> '
-            '<gml:upperCorner>151750.000000 214775.000000</gml:upperCorner> '
-            '</gml:Envelope> </ogc:Within> </ogc:And> </ogc:Filter> '
-            '</wfs:Query> </wfs:GetFeature>')
-
-    def test_wfs_build_getfeature_request_sortby(self):
-        """Test the owsutil.wfs_build_getfeature_request method with a sortby.
-
-        Test whether the XML of the WFS GetFeature call is generated correctly.
-
-        """
-        sort_by = SortBy([SortProperty('diepte_tot_m', 'DESC')])
-
-        sort_by = etree.tostring(sort_by.toXML(), encoding='unicode')
-
-        xml = owsutil.wfs_build_getfeature_request(
-            'dov-pub:Boringen', propertyname=['fiche', 'diepte_tot_m'],
-            sort_by=sort_by)
-        assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
-            'typeName="dov-pub:Boringen"><wfs:PropertyName>diepte_tot_m</wfs'
-            ':PropertyName><wfs:PropertyName>fiche</wfs:PropertyName'
-            '><ogc:Filter/><ogc:SortBy><ogc:SortProperty><ogc:PropertyName'
-            '>diepte_tot_m</ogc:PropertyName><ogc:SortOrder>DESC</ogc'
-            ':SortOrder></ogc:SortProperty></ogc:SortBy></wfs:Query></wfs'
-            ':GetFeature>')
-
-    def test_wfs_build_getfeature_request_sortby_multi(self):
-        """Test the owsutil.wfs_build_getfeature_request method with a
-        sortby containing multiple sort properties.
-
-        Test whether the XML of the WFS GetFeature call is generated correctly.
-
-        """
-        sort_by = SortBy([SortProperty('diepte_tot_m', 'DESC'),
-                          SortProperty('datum_aanvang', 'ASC')])
-
-        sort_by = etree.tostring(sort_by.toXML(), encoding='unicode')
-
-        xml = owsutil.wfs_build_getfeature_request(
-            'dov-pub:Boringen', propertyname=['fiche', 'diepte_tot_m'],
-            sort_by=sort_by)
-
-        assert clean_xml(etree.tostring(xml).decode('utf8')) == clean_xml(
-            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
-            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-            'service="WFS" version="1.1.0" '
-            'xsi:schemaLocation="http://www.opengis.net/wfs '
-            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd"><wfs:Query '
-            'typeName="dov-pub:Boringen"><wfs:PropertyName>diepte_tot_m</wfs'
-            ':PropertyName><wfs:PropertyName>fiche</wfs:PropertyName'
-            '><ogc:Filter/><ogc:SortBy><ogc:SortProperty><ogc:PropertyName'
-            '>diepte_tot_m</ogc:PropertyName><ogc:SortOrder>DESC</ogc'
-            ':SortOrder></ogc:SortProperty><ogc:SortProperty><ogc'
-            ':PropertyName>datum_aanvang</ogc:PropertyName><ogc:SortOrder>ASC'
-            '</ogc:SortOrder></ogc:SortProperty></ogc:SortBy></wfs:Query>'
-            '</wfs:GetFeature>')